@@ -6,9 +6,9 @@ This example demonstrates the basic usage of the teleoperation system
 with a 6DOF robot arm and keyboard controls.
 """
 
+import argparse
+import asyncio
 import sys
-import time
-import threading
 from typing import Dict, Any
 
 # Add the parent directory to the path so we can import the src module
@@ -16,28 +16,40 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.common.interfaces import (
-    Command, Pose, Vector3, Quaternion
+    IDENTITY_QUAT, Command, Pose, Vector3
 )
 from src.simulation.simulator import Simulator
 from src.robots.robot_model import Arm6DOF
 from src.operator.ui import OperatorUI
 from src.communication.network import NetworkSimulator
+from src.common.utils import configure_logging
 
 
-def keyboard_input_simulator(ui: OperatorUI, stop_event: threading.Event) -> None:
+# Keys pressed in turn by the simulated operator
+KEYS = ['w', 'a', 's', 'd', 'w', 'w', 's', 's', 'a', 'd']
+
+# Loop rates: physics runs every step, while the network exchange and
+# the operator display only need to run every few physics steps
+PHYSICS_DT = 0.005  # 5ms physics step
+NET_DT = 0.02  # 20ms network exchange
+DISPLAY_DT = 0.05  # 50ms display refresh
+NET_EVERY = int(round(NET_DT / PHYSICS_DT))
+DISPLAY_EVERY = int(round(DISPLAY_DT / PHYSICS_DT))
+
+
+async def input_producer(ui: OperatorUI) -> None:
     """
-    Simulate keyboard input for the operator UI.
+    Simulate keyboard input for the operator UI until cancelled.
     
     Args:
         ui: The operator UI instance.
-        stop_event: Event to signal when to stop.
     """
-    keys = ['w', 'a', 's', 'd', 'w', 'w', 's', 's', 'a', 'd']
+    loop = asyncio.get_running_loop()
     idx = 0
     
-    while not stop_event.is_set():
+    while True:
         # Simulate keyboard input
-        key = keys[idx % len(keys)]
+        key = KEYS[idx % len(KEYS)]
         
         input_data = {
             "type": "keyboard",
@@ -45,7 +57,7 @@ def keyboard_input_simulator(ui: OperatorUI, stop_event: threading.Event) -> Non
         }
         
         # Process the input
-        command = ui.process_input(input_data)
+        command = ui.process_input(input_data, loop.time())
         if command:
             print(f"Generated command: {command.type}")
         
@@ -53,18 +65,144 @@ def keyboard_input_simulator(ui: OperatorUI, stop_event: threading.Event) -> Non
         idx += 1
         
         # Wait for a bit
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+
+
+def step_teleop(simulator: Simulator, network: NetworkSimulator,
+                operator: OperatorUI, robot_id: str, dt: float, n: int) -> None:
+    """
+    Run one physics step and any network/display work due on it.
+    
+    Args:
+        simulator: The simulator instance.
+        network: The network simulator instance.
+        operator: The operator UI instance.
+        robot_id: ID of the controlled robot.
+        dt: Time step in seconds.
+        n: Index of the physics step.
+    """
+    # Step simulation
+    simulator.step(dt)
+    
+    if n % NET_EVERY == 0:
+        # Process commands at robot
+        robot_command = network.receive_latest_command()
+        if robot_command:
+            print(f"Robot received command: {robot_command.type}")
+            simulator.apply_command(robot_id, robot_command)
+        
+        # Get robot state
+        robot_state = simulator.get_robot_state(robot_id)
+        
+        # Send state to operator
+        network.send_state(robot_state)
+    
+    if n % DISPLAY_EVERY == 0:
+        # Update operator display
+        operator_state = network.receive_latest_state()
+        if operator_state:
+            operator.update_display(operator_state)
+
+
+async def run_realtime(simulator: Simulator, network: NetworkSimulator,
+                       operator: OperatorUI, robot_id: str,
+                       dt: float, end_time: float) -> None:
+    """
+    Run the simulation paced by the wall clock.
+    
+    Step n is due at t0 + n * dt, so sleep errors do not accumulate as
+    drift. Each step advances the simulation by the wall-clock time that
+    actually elapsed. Keyboard input is produced by a task on the same
+    event loop, so no extra thread is needed.
+    """
+    loop = asyncio.get_running_loop()
+    input_task = asyncio.create_task(input_producer(operator))
+    
+    try:
+        simulation_time = 0.0
+        steps_per_report = int(round(1.0 / dt))
+        
+        n = 0
+        t0 = loop.time()
+        prev = t0
+        lateness = 0.0  # Accumulated deviation from the ideal schedule
+        
+        while simulation_time < end_time:
+            now = loop.time()
+            dt_wc = now - prev
+            prev = now
+            
+            step_teleop(simulator, network, operator, robot_id, dt_wc, n)
+            simulation_time += dt_wc
+            n += 1
+            
+            # Print simulation progress
+            if n % steps_per_report == 0:
+                print(f"Simulation time: {simulation_time:.1f}s")
+            
+            # Report when the loop falls a full step behind schedule
+            if n > 1:
+                lateness += dt_wc - dt
+            if lateness > dt:
+                print(f"Warning: simulation loop is {lateness * 1000:.0f}ms behind schedule")
+                lateness = 0.0
+            
+            # Sleep until the next step is due, letting the input task run
+            await asyncio.sleep(max(0.0, t0 + n * dt - loop.time()))
+    finally:
+        input_task.cancel()
+        try:
+            await input_task
+        except asyncio.CancelledError:
+            pass
 
 
-def main():
-    """Run a simple teleoperation example."""
+def run_headless(simulator: Simulator, network: NetworkSimulator,
+                 operator: OperatorUI, robot_id: str,
+                 dt: float, end_time: float) -> None:
+    """
+    Run the simulation as fast as possible on a virtual clock.
+    
+    The network must be created with ``realtime=False``; it is advanced
+    in lockstep with the simulator, so runs are reproducible.
+    """
+    steps = int(round(end_time / dt))
+    steps_per_report = int(round(1.0 / dt))
+    steps_per_key = int(round(0.5 / dt))
+    
+    for n in range(steps):
+        # Simulate keyboard input every half second of simulation time
+        if n % steps_per_key == 0:
+            key = KEYS[(n // steps_per_key) % len(KEYS)]
+            command = operator.process_input({"type": "keyboard", "key": key},
+                                             simulator.time)
+            if command:
+                print(f"Generated command: {command.type}")
+        
+        step_teleop(simulator, network, operator, robot_id, dt, n)
+        network.advance(dt)
+        
+        # Print simulation progress
+        if (n + 1) % steps_per_report == 0:
+            print(f"Simulation time: {simulator.time:.1f}s")
+
+
+def main(headless: bool = False):
+    """
+    Run a simple teleoperation example.
+    
+    Args:
+        headless: Run on a virtual clock as fast as possible instead of
+            in real time.
+    """
+    configure_logging()
     print("Starting simple teleoperation example")
     
     # Create a robot and add it to the simulator
     robot_id = "robot1"
     robot_pose = Pose(
         position=Vector3(x=0.0, y=0.0, z=0.5),
-        orientation=Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
+        orientation=IDENTITY_QUAT
     )
     
     # Initialize simulator
@@ -74,7 +212,7 @@ def main():
     simulator.add_robot(robot_id, "arm_6dof", robot_pose)
     
     # Initialize communication network
-    network = NetworkSimulator()
+    network = NetworkSimulator(realtime=not headless)
     network.set_network_conditions(
         latency=0.1,  # 100ms latency
         packet_loss=0.05,  # 5% packet loss
@@ -86,66 +224,30 @@ def main():
     operator = OperatorUI(robot_id, "simple")
     print("Operator UI initialized")
     
-    # Create a thread to simulate keyboard input
-    stop_event = threading.Event()
-    input_thread = threading.Thread(
-        target=keyboard_input_simulator,
-        args=(operator, stop_event)
-    )
-    input_thread.start()
+    dt = PHYSICS_DT
+    end_time = 10.0  # Run for 10 seconds
+    print(f"Running simulation for {end_time} seconds...")
     
     try:
-        # Main simulation loop
-        dt = 0.02  # 20ms timestep
-        last_time = time.time()
-        simulation_time = 0.0
-        end_time = 10.0  # Run for 10 seconds
-        
-        print(f"Running simulation for {end_time} seconds...")
-        
-        while simulation_time < end_time:
-            current_time = time.time()
-            elapsed = current_time - last_time
-            
-            if elapsed >= dt:
-                # Step simulation
-                simulator.step(elapsed)
-                simulation_time += elapsed
-                last_time = current_time
-                
-                # Process commands at robot
-                robot_command = network.receive_command()
-                if robot_command:
-                    print(f"Robot received command: {robot_command.type}")
-                    simulator.apply_command(robot_id, robot_command)
-                
-                # Get robot state
-                robot_state = simulator.get_robot_state(robot_id)
-                
-                # Send state to operator
-                network.send_state(robot_state)
-                
-                # Update operator display
-                operator_state = network.receive_state()
-                if operator_state:
-                    operator.update_display(operator_state)
-                
-                # Print simulation progress
-                if int(simulation_time) != int(simulation_time - elapsed):
-                    print(f"Simulation time: {simulation_time:.1f}s")
-            
-            # Sleep to avoid busy waiting
-            time.sleep(0.001)
-            
+        if headless:
+            run_headless(simulator, network, operator, robot_id, dt, end_time)
+        else:
+            asyncio.run(
+                run_realtime(simulator, network, operator, robot_id, dt, end_time)
+            )
     except KeyboardInterrupt:
         print("Simulation interrupted")
     finally:
         # Clean up
-        stop_event.set()
-        input_thread.join()
         network.shutdown()
         print("Simulation ended")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simple teleoperation example")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run on a virtual clock as fast as possible"
+    )
+    main(parser.parse_args().headless)
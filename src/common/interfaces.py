@@ -5,41 +5,93 @@ This module defines abstract classes and protocols that establish
 the contracts between different modules in the system.
 """
 
+import pickle
+import struct
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
 import numpy as np
 
 
 # Data structures for inter-module communication
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vector3:
     """3D vector representation."""
     x: float
     y: float
     z: float
+    # Scratch buffer reused by to_array, allocated on first use
+    _arr: Optional[np.ndarray] = field(default=None, init=False,
+                                       repr=False, compare=False)
     
     def to_array(self) -> np.ndarray:
-        """Convert to numpy array."""
+        """
+        Convert to numpy array.
+        
+        The returned array is a buffer owned by this vector and is
+        overwritten by the next call; use to_array_copy() to keep it.
+        """
+        arr = self._arr
+        if arr is None:
+            arr = np.empty(3)
+            object.__setattr__(self, '_arr', arr)
+        arr[0] = self.x
+        arr[1] = self.y
+        arr[2] = self.z
+        return arr
+    
+    def to_array_copy(self) -> np.ndarray:
+        """Convert to a newly allocated numpy array."""
         return np.array([self.x, self.y, self.z])
     
     @classmethod
     def from_array(cls, array: np.ndarray) -> 'Vector3':
         """Create from numpy array."""
         return cls(x=float(array[0]), y=float(array[1]), z=float(array[2]))
+    
+    def __getstate__(self) -> Tuple[float, float, float]:
+        """Pickle the components only, not the scratch buffer."""
+        return (self.x, self.y, self.z)
+    
+    def __setstate__(self, state: Tuple[float, float, float]) -> None:
+        """Restore from pickled components."""
+        for name, value in zip(('x', 'y', 'z'), state):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_arr', None)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Quaternion:
     """Quaternion for 3D rotation representation."""
     w: float
     x: float
     y: float
     z: float
+    # Scratch buffer reused by to_array, allocated on first use
+    _arr: Optional[np.ndarray] = field(default=None, init=False,
+                                       repr=False, compare=False)
     
     def to_array(self) -> np.ndarray:
-        """Convert to numpy array."""
+        """
+        Convert to numpy array.
+        
+        The returned array is a buffer owned by this quaternion and is
+        overwritten by the next call; use to_array_copy() to keep it.
+        """
+        arr = self._arr
+        if arr is None:
+            arr = np.empty(4)
+            object.__setattr__(self, '_arr', arr)
+        arr[0] = self.w
+        arr[1] = self.x
+        arr[2] = self.y
+        arr[3] = self.z
+        return arr
+    
+    def to_array_copy(self) -> np.ndarray:
+        """Convert to a newly allocated numpy array."""
         return np.array([self.w, self.x, self.y, self.z])
     
     @classmethod
@@ -47,16 +99,73 @@ class Quaternion:
         """Create from numpy array."""
         return cls(w=float(array[0]), x=float(array[1]), 
                    y=float(array[2]), z=float(array[3]))
+    
+    def rotate(self, v: np.ndarray) -> np.ndarray:
+        """
+        Rotate a vector by this unit quaternion.
+        
+        Uses v' = v + w t + q x t with t = 2 (q x v), which is cheaper
+        than building a rotation matrix.
+        
+        Args:
+            v: Vector as a 3-element sequence.
+            
+        Returns:
+            Rotated vector as a new 3-element array.
+        """
+        w, qx, qy, qz = self.w, self.x, self.y, self.z
+        vx, vy, vz = v[0], v[1], v[2]
+        tx = 2.0 * (qy * vz - qz * vy)
+        ty = 2.0 * (qz * vx - qx * vz)
+        tz = 2.0 * (qx * vy - qy * vx)
+        out = np.empty(3)
+        out[0] = vx + w * tx + qy * tz - qz * ty
+        out[1] = vy + w * ty + qz * tx - qx * tz
+        out[2] = vz + w * tz + qx * ty - qy * tx
+        return out
+    
+    def rotate_batch(self, v: np.ndarray) -> np.ndarray:
+        """
+        Rotate several vectors by this unit quaternion.
+        
+        Args:
+            v: Vectors as an (N, 3) array.
+            
+        Returns:
+            Rotated vectors as a new (N, 3) array.
+        """
+        q = np.array([self.x, self.y, self.z])
+        t = 2.0 * np.cross(q, v)
+        return v + self.w * t + np.cross(q, t)
+    
+    def __getstate__(self) -> Tuple[float, float, float, float]:
+        """Pickle the components only, not the scratch buffer."""
+        return (self.w, self.x, self.y, self.z)
+    
+    def __setstate__(self, state: Tuple[float, float, float, float]) -> None:
+        """Restore from pickled components."""
+        for name, value in zip(('w', 'x', 'y', 'z'), state):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_arr', None)
 
 
-@dataclass
+# Rotation-free orientation, shared instead of building a new one per use
+IDENTITY_QUAT = Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
+
+
+@dataclass(slots=True, frozen=True)
 class Pose:
     """Representation of position and orientation."""
     position: Vector3
     orientation: Quaternion
 
 
-@dataclass
+# Origin of a frame, shared like IDENTITY_QUAT
+ORIGIN = Vector3(x=0.0, y=0.0, z=0.0)
+IDENTITY_POSE = Pose(position=ORIGIN, orientation=IDENTITY_QUAT)
+
+
+@dataclass(slots=True, frozen=True)
 class JointState:
     """State of a robot joint."""
     position: float
@@ -66,19 +175,201 @@ class JointState:
 
 
 @dataclass
+class RobotStateArrays:
+    """
+    Structure-of-arrays form of a robot state.
+    
+    Joint quantities are stored as contiguous float arrays indexed like
+    ``names``, which is cheaper to copy, serialize and compute on than a
+    list of JointState objects.
+    """
+    positions: np.ndarray
+    velocities: np.ndarray
+    efforts: np.ndarray
+    names: Tuple[str, ...]
+    pose_position: Optional[np.ndarray] = None
+    pose_orientation: Optional[np.ndarray] = None
+    timestamp: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
 class RobotState:
     """Complete state of a robot."""
     joint_states: List[JointState]
     pose: Optional[Pose] = None
     timestamp: float = 0.0
+    
+    def to_arrays(self) -> RobotStateArrays:
+        """Convert to structure-of-arrays form."""
+        joints = self.joint_states
+        n = len(joints)
+        pose = self.pose
+        return RobotStateArrays(
+            positions=np.fromiter((j.position for j in joints), float, n),
+            velocities=np.fromiter((j.velocity for j in joints), float, n),
+            efforts=np.fromiter((j.effort for j in joints), float, n),
+            names=tuple(j.name for j in joints),
+            pose_position=pose.position.to_array_copy() if pose else None,
+            pose_orientation=pose.orientation.to_array_copy() if pose else None,
+            timestamp=self.timestamp
+        )
+    
+    @classmethod
+    def from_arrays(cls, arrays: RobotStateArrays) -> 'RobotState':
+        """Create from structure-of-arrays form."""
+        joint_states = [
+            JointState(position=p, velocity=v, effort=e, name=name)
+            for p, v, e, name in zip(arrays.positions.tolist(),
+                                     arrays.velocities.tolist(),
+                                     arrays.efforts.tolist(),
+                                     arrays.names)
+        ]
+        pose = None
+        if arrays.pose_position is not None and arrays.pose_orientation is not None:
+            pose = Pose(
+                position=Vector3.from_array(arrays.pose_position),
+                orientation=Quaternion.from_array(arrays.pose_orientation)
+            )
+        return cls(joint_states=joint_states, pose=pose,
+                   timestamp=arrays.timestamp)
 
 
-@dataclass
+class CmdType(IntEnum):
+    """Command types understood by robots."""
+    JOINT_POSITION = 0
+    VELOCITY = 1
+    CARTESIAN = 2
+    GRIPPER = 3
+    
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+# Legacy string command types, e.g. "joint_position"
+_CMD_TYPES_BY_NAME = {t.name.lower(): t for t in CmdType}
+
+# Wire formats of Command.encode. Each starts with a tag byte holding the
+# CmdType value and the float64 timestamp; values are float32.
+_VELOCITY_STRUCT = struct.Struct("<Bdff")
+_JOINT_POSITION_HEADER = struct.Struct("<BdB")
+
+# Tag byte of encoded payloads that fall back to pickle
+PICKLE_TAG = 0xFF
+_PICKLE_PREFIX = bytes([PICKLE_TAG])
+
+# Batches are a tag byte and record count followed by length-prefixed
+# records
+BATCH_TAG = 0xFE
+_BATCH_HEADER = struct.Struct("<BH")
+MAX_BATCH_SIZE = 0xFFFF
+_RECORD_LENGTH = struct.Struct("<I")
+
+
+@dataclass(slots=True, frozen=True)
 class Command:
-    """Command sent from operator to robot."""
-    type: str
+    """
+    Command sent from operator to robot.
+    
+    ``type`` may also be given as a legacy string such as ``"velocity"``;
+    known names are converted to CmdType and unknown ones kept as is.
+    """
+    type: Union[CmdType, str]
     data: Dict[str, Any]
     timestamp: float
+    
+    def __post_init__(self) -> None:
+        if isinstance(self.type, str):
+            cmd_type = _CMD_TYPES_BY_NAME.get(self.type)
+            if cmd_type is not None:
+                object.__setattr__(self, 'type', cmd_type)
+    
+    def encode(self) -> bytes:
+        """
+        Encode to a compact binary record.
+        
+        Velocity commands with 'linear' and 'angular' data and joint
+        position commands with 'positions' data are packed with float32
+        values; velocity commands take 17 bytes. Other commands fall back
+        to pickle.
+        """
+        data = self.data
+        try:
+            if self.type is CmdType.VELOCITY and data.keys() == {"linear", "angular"}:
+                return _VELOCITY_STRUCT.pack(CmdType.VELOCITY, self.timestamp,
+                                             data["linear"], data["angular"])
+            if self.type is CmdType.JOINT_POSITION and data.keys() == {"positions"}:
+                positions = np.asarray(data["positions"], dtype='<f4')
+                if positions.ndim == 1 and positions.size < 256:
+                    return _JOINT_POSITION_HEADER.pack(
+                        CmdType.JOINT_POSITION, self.timestamp, positions.size
+                    ) + positions.tobytes()
+        except (struct.error, TypeError, ValueError):
+            pass  # Non-numeric values
+        return _PICKLE_PREFIX + pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @staticmethod
+    def encode_batch(items: List[Any]) -> bytes:
+        """
+        Encode several commands into one record that decodes to a list.
+        
+        Args:
+            items: Commands, commands already encoded with encode(), or
+                other objects, which are pickled.
+            
+        Returns:
+            Encoded batch.
+            
+        Raises:
+            ValueError: If there are more than MAX_BATCH_SIZE items.
+        """
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValueError(
+                f"Batch of {len(items)} items exceeds the maximum of "
+                f"{MAX_BATCH_SIZE}"
+            )
+        parts = [_BATCH_HEADER.pack(BATCH_TAG, len(items))]
+        for item in items:
+            if isinstance(item, Command):
+                record = item.encode()
+            elif isinstance(item, bytes):
+                record = item
+            else:
+                record = _PICKLE_PREFIX + pickle.dumps(
+                    item, protocol=pickle.HIGHEST_PROTOCOL)
+            parts.append(_RECORD_LENGTH.pack(len(record)))
+            parts.append(record)
+        return b"".join(parts)
+    
+    @classmethod
+    def decode(cls, buf: bytes) -> Any:
+        """
+        Decode a record produced by encode() or encode_batch().
+        
+        Joint positions are decoded to a list of floats. A batch decodes
+        to a list of its items, and a pickle fallback record to whatever
+        object was pickled.
+        """
+        tag = buf[0]
+        if tag == CmdType.VELOCITY:
+            _, timestamp, linear, angular = _VELOCITY_STRUCT.unpack(buf)
+            return cls(CmdType.VELOCITY,
+                       {"linear": linear, "angular": angular}, timestamp)
+        if tag == CmdType.JOINT_POSITION:
+            _, timestamp, n = _JOINT_POSITION_HEADER.unpack_from(buf)
+            positions = np.frombuffer(buf, '<f4', n, _JOINT_POSITION_HEADER.size)
+            return cls(CmdType.JOINT_POSITION,
+                       {"positions": positions.tolist()}, timestamp)
+        if tag == BATCH_TAG:
+            _, count = _BATCH_HEADER.unpack_from(buf)
+            offset = _BATCH_HEADER.size
+            items = []
+            for _ in range(count):
+                (length,) = _RECORD_LENGTH.unpack_from(buf, offset)
+                offset += _RECORD_LENGTH.size
+                items.append(cls.decode(buf[offset:offset + length]))
+                offset += length
+            return items
+        return pickle.loads(memoryview(buf)[1:])
 
 
 # Simulation Module Interface
@@ -123,8 +414,14 @@ class RobotInterface(ABC):
         pass
     
     @abstractmethod
-    def apply_command(self, command: Command) -> None:
-        """Apply a command to the robot."""
+    def apply_command(self, command: Command,
+                      seed: Optional[np.ndarray] = None) -> None:
+        """
+        Apply a command to the robot.
+        
+        ``seed`` optionally warm-starts inverse kinematics for commands
+        that need it; robots default to their current joint positions.
+        """
         pass
     
     @abstractmethod
@@ -139,8 +436,15 @@ class OperatorInterface(ABC):
     """Interface for the operator module."""
     
     @abstractmethod
-    def process_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
-        """Process operator input and generate command."""
+    def process_input(self, input_data: Dict[str, Any],
+                      now: Optional[float] = None) -> Optional[Command]:
+        """
+        Process operator input and generate command.
+        
+        ``now`` stamps generated commands, so all events handled in one
+        tick share a timestamp; implementations default to the current
+        time.
+        """
         pass
     
     @abstractmethod
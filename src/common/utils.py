@@ -7,18 +7,55 @@ of the teleoperation system.
 
 import time
 import logging
-from typing import Any, Callable, Dict, Optional, TypeVar, Union
+import selectors
+import threading
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 import numpy as np
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Whether configure_logging has set up the root logger
+_CONFIGURED = False
+
+# Checked by hot paths before debug logging, so disabled debug output
+# costs a single global lookup instead of a logger level check
+_DEBUG_ENABLED = False
+
+# Parent logger of all module loggers in the package
+_PACKAGE_LOGGER = "src"
 
 T = TypeVar('T')
 
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure the root logger for the teleoperation system.
+    
+    Only the first call has an effect, so applications that configure
+    logging themselves keep their setup. Call this from entry points,
+    not at import time.
+    """
+    global _CONFIGURED, _DEBUG_ENABLED
+    if _CONFIGURED:
+        return
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+    _DEBUG_ENABLED = level <= logging.DEBUG
+    _CONFIGURED = True
+
+def set_debug(on: bool) -> None:
+    """
+    Enable or disable debug logging, including on hot paths.
+    
+    Only the package's own logger is changed, never the root logger.
+    Disabling resets it to NOTSET, so the level configured by
+    configure_logging or by the application applies again.
+    """
+    global _DEBUG_ENABLED
+    _DEBUG_ENABLED = on
+    logging.getLogger(_PACKAGE_LOGGER).setLevel(
+        logging.DEBUG if on else logging.NOTSET
+    )
+
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance for a module."""
     return logging.getLogger(name)
@@ -27,9 +64,9 @@ def time_function(func: Callable[..., T]) -> Callable[..., T]:
     """Decorator to measure and log the execution time of a function."""
     def wrapper(*args: Any, **kwargs: Any) -> T:
         logger = get_logger(func.__module__)
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.debug(f"Function {func.__name__} took {elapsed_time:.4f} seconds to run")
         return result
     return wrapper
@@ -37,44 +74,196 @@ def time_function(func: Callable[..., T]) -> Callable[..., T]:
 def throttle(period: float) -> Callable[[Callable[..., T]], Callable[..., Optional[T]]]:
     """
     Decorator to throttle a function to run at most once per period (in seconds).
-    Returns None when throttled.
+    Returns None when throttled. Safe to call from multiple threads.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., Optional[T]]:
-        last_execution = 0.0
+        lock = threading.Lock()
+        last_execution = float('-inf')
         
         def wrapper(*args: Any, **kwargs: Any) -> Optional[T]:
             nonlocal last_execution
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            if current_time - last_execution >= period:
+            # Check and claim the slot atomically so only one caller runs
+            with lock:
+                if current_time - last_execution < period:
+                    return None
                 last_execution = current_time
-                return func(*args, **kwargs)
-            return None
+            return func(*args, **kwargs)
             
         return wrapper
     return decorator
 
-def transform_pose(pose: Dict[str, Any], 
-                   translation: np.ndarray, 
-                   rotation_matrix: np.ndarray) -> Dict[str, Any]:
-    """Transform a pose by a translation and rotation."""
-    position = np.array([pose['position']['x'], 
-                         pose['position']['y'], 
-                         pose['position']['z']])
+class DeadlineSleeper:
+    """
+    Waits until absolute ``time.perf_counter()`` deadlines.
     
-    # Apply transformation
-    new_position = np.dot(rotation_matrix, position) + translation
+    ``time.sleep`` routinely overshoots by up to a scheduler tick. The
+    sleeper therefore sleeps for the bulk of the wait, leaving a margin
+    equal to the worst oversleep among the last few waits, and spins for
+    the remainder.
+    """
+    
+    def __init__(self, history: int = 8):
+        """
+        Initialize the sleeper.
+        
+        Args:
+            history: Number of recent oversleeps used to size the margin.
+        """
+        self._sleep_errors = [0.0] * history
+        self._idx = 0
     
-    # Update pose
-    new_pose = pose.copy()
-    new_pose['position']['x'] = float(new_position[0])
-    new_pose['position']['y'] = float(new_position[1])
-    new_pose['position']['z'] = float(new_position[2])
+    def wait_until(self, deadline: float,
+                   selector: Optional[selectors.BaseSelector] = None) -> List[Any]:
+        """
+        Block until ``time.perf_counter()`` reaches the deadline.
+        
+        Args:
+            deadline: Absolute deadline on the ``perf_counter`` clock.
+            selector: Optional selector to wait on instead of sleeping.
+                The wait ends early if one of its files becomes ready.
+            
+        Returns:
+            The selector's ready events if the wait ended early,
+            otherwise an empty list.
+        """
+        requested = deadline - time.perf_counter() - max(self._sleep_errors)
+        if requested > 0:
+            start = time.perf_counter()
+            if selector is not None:
+                events = selector.select(requested)
+                if events:
+                    return events
+            else:
+                time.sleep(requested)
+            self._sleep_errors[self._idx] = max(
+                0.0, time.perf_counter() - start - requested
+            )
+            self._idx = (self._idx + 1) % len(self._sleep_errors)
+        
+        while time.perf_counter() < deadline:
+            pass
+        return []
+
+def transform_pose(position: np.ndarray,
+                   rotation_matrix: np.ndarray,
+                   translation: np.ndarray) -> np.ndarray:
+    """
+    Rotate and translate a position.
     
-    # TODO: Implement quaternion rotation
+    The 3x3 product is written out by hand because BLAS dispatch costs far
+    more than the arithmetic at this size.
+    
+    Args:
+        position: Position as a 3-element array.
+        rotation_matrix: 3x3 rotation matrix.
+        translation: Translation as a 3-element array.
+        
+    Returns:
+        Transformed position as a new 3-element array.
+    """
+    x, y, z = position[0], position[1], position[2]
+    r = rotation_matrix
+    out = np.empty(3)
+    out[0] = r[0, 0] * x + r[0, 1] * y + r[0, 2] * z + translation[0]
+    out[1] = r[1, 0] * x + r[1, 1] * y + r[1, 2] * z + translation[1]
+    out[2] = r[2, 0] * x + r[2, 1] * y + r[2, 2] * z + translation[2]
+    return out
+
+def transform_pose_dict(pose: Dict[str, Any],
+                        translation: np.ndarray,
+                        rotation_matrix: np.ndarray) -> Dict[str, Any]:
+    """
+    Transform a dict pose by a translation and rotation.
+    
+    The orientation, if present as a ``{'w', 'x', 'y', 'z'}`` dict, is
+    rotated as well. The input pose is not modified.
+    """
+    p = pose['position']
+    new_position = transform_pose(
+        (p['x'], p['y'], p['z']), rotation_matrix, translation
+    )
+    
+    new_pose = dict(pose)
+    new_pose['position'] = {
+        'x': float(new_position[0]),
+        'y': float(new_position[1]),
+        'z': float(new_position[2]),
+    }
+    
+    if 'orientation' in pose:
+        o = pose['orientation']
+        q = quaternion_multiply(
+            rotation_matrix_to_quaternion(rotation_matrix),
+            (o['w'], o['x'], o['y'], o['z'])
+        )
+        new_pose['orientation'] = {
+            'w': float(q[0]), 'x': float(q[1]),
+            'y': float(q[2]), 'z': float(q[3]),
+        }
     
     return new_pose
 
+def quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Hamilton product of two (w, x, y, z) quaternions.
+    
+    Args:
+        a: Left quaternion.
+        b: Right quaternion.
+        
+    Returns:
+        Product ``a * b`` as a new 4-element array.
+    """
+    aw, ax, ay, az = a[0], a[1], a[2], a[3]
+    bw, bx, by, bz = b[0], b[1], b[2], b[3]
+    out = np.empty(4)
+    out[0] = aw * bw - ax * bx - ay * by - az * bz
+    out[1] = aw * bx + ax * bw + ay * bz - az * by
+    out[2] = aw * by - ax * bz + ay * bw + az * bx
+    out[3] = aw * bz + ax * by - ay * bx + az * bw
+    return out
+
+def rotation_matrix_to_quaternion(rotation_matrix: np.ndarray) -> np.ndarray:
+    """
+    Convert a 3x3 rotation matrix to a unit (w, x, y, z) quaternion.
+    
+    Args:
+        rotation_matrix: 3x3 rotation matrix.
+        
+    Returns:
+        Equivalent quaternion as a 4-element array.
+    """
+    r = rotation_matrix
+    trace = r[0, 0] + r[1, 1] + r[2, 2]
+    # Branch on the largest diagonal term for numerical stability
+    if trace > 0:
+        s = 2.0 * np.sqrt(trace + 1.0)
+        q = (0.25 * s,
+             (r[2, 1] - r[1, 2]) / s,
+             (r[0, 2] - r[2, 0]) / s,
+             (r[1, 0] - r[0, 1]) / s)
+    elif r[0, 0] > r[1, 1] and r[0, 0] > r[2, 2]:
+        s = 2.0 * np.sqrt(1.0 + r[0, 0] - r[1, 1] - r[2, 2])
+        q = ((r[2, 1] - r[1, 2]) / s,
+             0.25 * s,
+             (r[0, 1] + r[1, 0]) / s,
+             (r[0, 2] + r[2, 0]) / s)
+    elif r[1, 1] > r[2, 2]:
+        s = 2.0 * np.sqrt(1.0 + r[1, 1] - r[0, 0] - r[2, 2])
+        q = ((r[0, 2] - r[2, 0]) / s,
+             (r[0, 1] + r[1, 0]) / s,
+             0.25 * s,
+             (r[1, 2] + r[2, 1]) / s)
+    else:
+        s = 2.0 * np.sqrt(1.0 + r[2, 2] - r[0, 0] - r[1, 1])
+        q = ((r[1, 0] - r[0, 1]) / s,
+             (r[0, 2] + r[2, 0]) / s,
+             (r[1, 2] + r[2, 1]) / s,
+             0.25 * s)
+    return np.array(q)
+
 def format_float(value: float, precision: int = 3) -> str:
     """Format a float with specified precision for display."""
     return f"{value:.{precision}f}" 
\ No newline at end of file
@@ -7,4 +7,6 @@ and other communication aspects between the operator and robot.
 
 __version__ = "0.1.0"
 # Explicitly expose module contents
-from src.communication.network import NetworkSimulator 
\ No newline at end of file
+from src.communication.network import (
+    NETWORK_PRESETS, GilbertElliot, NetworkSimulator, RandomLoss
+) 
\ No newline at end of file
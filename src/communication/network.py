@@ -5,18 +5,451 @@ This module handles simulated communication between the operator
 and robot, including network effects like latency and packet loss.
 """
 
+import copy
+import functools
+import heapq
+import itertools
+import pickle
 import queue
-import random
+import socket
 import threading
 import time
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union, Any
+
+import numpy as np
 
 from src.common.interfaces import (
-    Command, CommunicationInterface, RobotState
+    PICKLE_TAG, CmdType, Command, CommunicationInterface, RobotState
 )
+from src.common import utils
 from src.common.utils import get_logger
 
 
+# Number of random samples drawn per refill of a channel's sample buffers
+_RNG_BATCH_SIZE = 4096
+
+# Maximum number of delivered items buffered at each receiving end
+_RECEIVE_QUEUE_SIZE = 64
+
+# Named jitter distributions accepted by NetworkChannel.set_conditions
+JITTER_DISTRIBUTIONS = ("uniform", "normal", "pareto")
+
+# Normal jitter samples are redrawn beyond this many standard deviations
+_JITTER_TRUNCATION = 3.0
+
+# Shape of the Pareto (Lomax) jitter distribution, whose mean is 1/(shape-1)
+_PARETO_SHAPE = 3.0
+
+
+class RandomLoss:
+    """
+    Independent (Bernoulli) packet loss model.
+    
+    Every packet is dropped with the same fixed probability.
+    """
+    
+    def __init__(self, probability: float = 0.0):
+        """
+        Initialize the loss model.
+        
+        Args:
+            probability: Packet loss probability (0.0-1.0).
+        """
+        self.probability = max(0.0, min(1.0, probability))
+    
+    @property
+    def loss_rate(self) -> float:
+        """Long-run fraction of dropped packets."""
+        return self.probability
+    
+    def drop(self, u: float) -> bool:
+        """
+        Decide whether to drop a packet.
+        
+        Args:
+            u: Uniform random sample in [0, 1).
+            
+        Returns:
+            True if the packet should be dropped.
+        """
+        return u < self.probability
+
+
+class GilbertElliot:
+    """
+    Two-state Gilbert-Elliot burst loss model.
+    
+    The link alternates between a good and a bad state following a
+    Markov chain, with a separate loss probability in each state. This
+    reproduces the bursty losses seen on wireless links, which an
+    independent loss model underestimates. Parameters follow the netem
+    convention.
+    """
+    
+    def __init__(self, p: float, r: float, h: float = 0.0, k: float = 1.0):
+        """
+        Initialize the loss model in the good state.
+        
+        Args:
+            p: Probability of moving from the good to the bad state.
+            r: Probability of moving from the bad to the good state.
+            h: Probability of delivery while in the bad state.
+            k: Probability of delivery while in the good state.
+        """
+        self.p = p
+        self.r = r
+        self.h = h
+        self.k = k
+        self.bad = False
+    
+    @classmethod
+    def wifi(cls) -> 'GilbertElliot':
+        """Short, frequent bursts typical of a congested Wi-Fi link."""
+        return cls(p=0.01, r=0.3, h=0.5, k=1.0)
+    
+    @classmethod
+    def cellular(cls) -> 'GilbertElliot':
+        """Longer outages typical of a cellular link during handover."""
+        return cls(p=0.005, r=0.1, h=0.3, k=0.999)
+    
+    @classmethod
+    def satellite(cls) -> 'GilbertElliot':
+        """Rare but long fades typical of a satellite link."""
+        return cls(p=0.002, r=0.05, h=0.1, k=0.995)
+    
+    @classmethod
+    def congested(cls) -> 'GilbertElliot':
+        """Frequent, lossy bursts typical of a link with full router queues."""
+        return cls(p=0.05, r=0.2, h=0.3, k=0.98)
+    
+    @property
+    def loss_rate(self) -> float:
+        """Long-run fraction of dropped packets."""
+        if self.p + self.r == 0:
+            return 1.0 - self.k
+        bad_fraction = self.p / (self.p + self.r)
+        return bad_fraction * (1.0 - self.h) + (1.0 - bad_fraction) * (1.0 - self.k)
+    
+    def drop(self, u: float) -> bool:
+        """
+        Advance the state and decide whether to drop a packet.
+        
+        A single uniform sample drives both decisions: the part of the
+        unit interval that selects the transition is rescaled to a fresh
+        uniform sample for the loss decision.
+        
+        Args:
+            u: Uniform random sample in [0, 1).
+            
+        Returns:
+            True if the packet should be dropped.
+        """
+        flip = self.r if self.bad else self.p
+        if u < flip:
+            self.bad = not self.bad
+            u = u / flip
+        else:
+            u = (u - flip) / (1.0 - flip)
+        delivery = self.h if self.bad else self.k
+        return u >= delivery
+
+
+def pop_latest(q: queue.Queue) -> Optional[Any]:
+    """
+    Drain a queue and return only its newest item.
+    
+    Args:
+        q: Queue to drain.
+        
+    Returns:
+        Most recently queued item, or None if the queue is empty.
+    """
+    latest = None
+    try:
+        while True:
+            latest = q.get_nowait()
+    except queue.Empty:
+        pass
+    return latest
+
+
+def drain(q: queue.Queue, max_items: int) -> List[Any]:
+    """
+    Take up to ``max_items`` items from a queue without blocking.
+    
+    Args:
+        q: Queue to drain.
+        max_items: Maximum number of items to take.
+        
+    Returns:
+        Items in queue order, possibly empty.
+    """
+    items = []
+    try:
+        while len(items) < max_items:
+            items.append(q.get_nowait())
+    except queue.Empty:
+        pass
+    return items
+
+
+def _call_each(callback: Callable[[Any], None], items: List[Any]) -> None:
+    """Pass each item of a delivered batch to a callback."""
+    for item in items:
+        callback(item)
+
+
+# Command types for which only the most recent command matters
+_COALESCED_COMMAND_TYPES = frozenset({CmdType.VELOCITY, CmdType.GRIPPER})
+
+
+def command_coalesce_key(command: Union[Command, bytes]) -> Optional[CmdType]:
+    """
+    Coalescing key for operator commands.
+    
+    Setpoint commands such as velocity supersede earlier ones of the same
+    type; one-shot commands such as joint positions and pre-encoded
+    commands are never coalesced.
+    """
+    cmd_type = getattr(command, "type", None)
+    return cmd_type if cmd_type in _COALESCED_COMMAND_TYPES else None
+
+
+def _encode_command_payload(data: Any) -> bytes:
+    """
+    Encode data sent on the operator-to-robot channel.
+    
+    Commands use their compact binary encoding, bytes are taken as
+    already encoded commands and batches are encoded record by record;
+    anything else is pickled behind the tag that Command.decode
+    recognizes.
+    """
+    if isinstance(data, Command):
+        return data.encode()
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, list):
+        return Command.encode_batch(data)
+    return bytes([PICKLE_TAG]) + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _pickle_dumps(data: Any) -> bytes:
+    """Default channel encoder."""
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def put_overwrite(q: queue.Queue, item: Any) -> None:
+    """
+    Put an item on a bounded queue, discarding the oldest item if full.
+    
+    Args:
+        q: Queue to put the item on.
+        item: Item to put.
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+class _Scheduler:
+    """
+    Delivery scheduler shared by all network channels.
+    
+    A single daemon thread sleeps until the earliest pending deadline
+    instead of each channel polling its own queue, so delivery times are
+    not quantized to a polling period and idle channels cost nothing.
+    """
+    
+    _instance: Optional['_Scheduler'] = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get(cls) -> '_Scheduler':
+        """Return the process-wide scheduler instance."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def __init__(self):
+        """Initialize the scheduler without starting its thread."""
+        self.logger = get_logger(__name__)
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, Any, Callable[[Any], None]]] = []
+        self._seq = itertools.count()
+        self._refcount = 0
+        self._generation = 0
+        self._thread: Optional[threading.Thread] = None
+    
+    def acquire(self) -> None:
+        """Register a user of the scheduler, starting the thread if needed."""
+        with self._cond:
+            self._refcount += 1
+            if self._thread is None:
+                self._generation += 1
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._generation,), daemon=True
+                )
+                self._thread.start()
+    
+    def release(self) -> None:
+        """Unregister a user, stopping the thread when none remain."""
+        thread = None
+        with self._cond:
+            self._refcount = max(0, self._refcount - 1)
+            if self._refcount == 0 and self._thread is not None:
+                thread = self._thread
+                self._thread = None
+                self._generation += 1
+                self._heap.clear()
+                self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+    
+    def now(self) -> float:
+        """Return the current time on the scheduler's clock."""
+        return time.monotonic()
+    
+    def schedule(self, deadline: float, data: Any,
+                 callback: Callable[[Any], None]) -> None:
+        """
+        Schedule a delivery.
+        
+        Args:
+            deadline: Delivery time on the ``time.monotonic()`` clock.
+            data: Data to deliver.
+            callback: Callable invoked with ``data`` at the deadline.
+        """
+        with self._cond:
+            entry = (deadline, next(self._seq), data, callback)
+            heapq.heappush(self._heap, entry)
+            # Only wake the thread if its current sleep is now too long
+            if self._heap[0] is entry:
+                self._cond.notify()
+    
+    def _run(self, generation: int) -> None:
+        """Deliver scheduled entries as their deadlines pass."""
+        heap = self._heap
+        while True:
+            with self._cond:
+                while generation == self._generation:
+                    if not heap:
+                        self._cond.wait()
+                        continue
+                    timeout = heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._cond.wait(timeout=timeout)
+                if generation != self._generation:
+                    return
+                
+                now = time.monotonic()
+                ready = []
+                while heap and heap[0][0] <= now:
+                    ready.append(heapq.heappop(heap))
+            
+            # Callbacks run outside the lock so they may send again
+            for _, _, data, callback in ready:
+                try:
+                    callback(data)
+                except Exception as e:
+                    self.logger.error("Error delivering scheduled data: %s", e)
+
+
+class _VirtualScheduler:
+    """
+    Delivery scheduler driven by an explicitly advanced virtual clock.
+    
+    Nothing is delivered until advance() is called, which fires every
+    delivery that has become due, synchronously and in deadline order.
+    Runs are therefore reproducible and go as fast as the caller steps
+    them, independent of wall-clock time.
+    """
+    
+    def __init__(self):
+        """Initialize the scheduler at virtual time zero."""
+        self.logger = get_logger(__name__)
+        self.time = 0.0
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, Any, Callable[[Any], None]]] = []
+        self._seq = itertools.count()
+    
+    def acquire(self) -> None:
+        """Register a user of the scheduler. No thread is needed."""
+    
+    def release(self) -> None:
+        """Unregister a user of the scheduler."""
+    
+    def now(self) -> float:
+        """Return the current virtual time."""
+        return self.time
+    
+    def schedule(self, deadline: float, data: Any,
+                 callback: Callable[[Any], None]) -> None:
+        """
+        Schedule a delivery.
+        
+        Args:
+            deadline: Delivery time on the virtual clock.
+            data: Data to deliver.
+            callback: Callable invoked with ``data`` at the deadline.
+        """
+        with self._lock:
+            heapq.heappush(self._heap, (deadline, next(self._seq), data, callback))
+    
+    def advance(self, dt: float) -> None:
+        """
+        Advance the virtual clock and fire all deliveries now due.
+        
+        Args:
+            dt: Time to advance in seconds.
+        """
+        with self._lock:
+            self.time += dt
+            target = self.time
+        
+        heap = self._heap
+        while True:
+            with self._lock:
+                if not heap or heap[0][0] > target:
+                    return
+                _, _, data, callback = heapq.heappop(heap)
+            # Callbacks may schedule further deliveries due in this step
+            try:
+                callback(data)
+            except Exception as e:
+                self.logger.error("Error delivering scheduled data: %s", e)
+
+
+# Named network conditions for NetworkSimulator.set_network_preset: base
+# latency and jitter in seconds, jitter distribution, loss model factory
+# and bandwidth in bytes per second
+NETWORK_PRESETS: Dict[str, Dict[str, Any]] = {
+    "wifi": {
+        "latency": 0.005, "jitter": 0.004, "jitter_distribution": "normal",
+        "loss_model": GilbertElliot.wifi, "bandwidth": 5e6,
+    },
+    "cellular": {
+        "latency": 0.05, "jitter": 0.02, "jitter_distribution": "pareto",
+        "loss_model": GilbertElliot.cellular, "bandwidth": 1e6,
+    },
+    "satellite": {
+        "latency": 0.3, "jitter": 0.01, "jitter_distribution": "normal",
+        "loss_model": GilbertElliot.satellite, "bandwidth": 2.5e5,
+    },
+    "congested": {
+        "latency": 0.1, "jitter": 0.05, "jitter_distribution": "pareto",
+        "loss_model": GilbertElliot.congested, "bandwidth": 1.25e5,
+    },
+}
+
+
 class NetworkChannel:
     """
     Simulated network channel for communication.
@@ -25,99 +458,306 @@ class NetworkChannel:
     latency, packet loss, and bandwidth restrictions.
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str,
+                 sink: Optional[Callable[[Any], None]] = None,
+                 seed: Optional[int] = None,
+                 scheduler: Optional[Any] = None,
+                 coalesce_key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+                 encode: Callable[[Any], bytes] = _pickle_dumps,
+                 decode: Callable[[bytes], Any] = pickle.loads):
         """
         Initialize a network channel.
         
         Args:
             name: Name of the channel.
+            sink: Default callable that receives delivered data.
+            seed: Seed for the channel's random generator, for
+                reproducible loss and jitter.
+            scheduler: Scheduler that times deliveries. Defaults to the
+                shared real-time scheduler.
+            coalesce_key: Callable mapping sent data to a key, or None.
+                Data sent with a key supersedes any undelivered data
+                sent earlier with the same key.
+            encode: Serializer applied to sent data. Defaults to pickle.
+            decode: Deserializer applied to delivered payloads.
         """
         self.logger = get_logger(__name__)
         self.name = name
-        self.queue = queue.PriorityQueue()
+        self.sink = sink
         self.latency = 0.0  # seconds
         self.jitter = 0.0  # seconds
         self.packet_loss = 0.0  # probability (0.0-1.0)
-        self.bandwidth = float('inf')  # bytes per second
-        self.thread = threading.Thread(target=self._process_queue, daemon=True)
+        self.bandwidth: Optional[float] = None  # bytes per second, None if unlimited
+        self._tx_time_per_byte = 0.0  # seconds, 0 when unlimited
+        self.jitter_distribution: Union[str, np.ndarray] = "normal"
+        self.loss_model: Any = RandomLoss(0.0)
         self.running = False
-        self.logger.info(f"Created network channel '{name}'")
+        self._scheduler = scheduler if scheduler is not None else _Scheduler.get()
+        
+        # Guards the random sample buffers and the link state
+        self._lock = threading.Lock()
+        
+        # Time at which the link finishes transmitting queued data
+        self._link_free_at = 0.0
+        
+        # Serialization of the data crossing the channel
+        self._encode = encode
+        self._decode = decode
+        
+        # Undelivered items by coalescing key
+        self.coalesce_key = coalesce_key
+        self._pending: Dict[Hashable, List[Any]] = {}
+        
+        # Loss and jitter samples are drawn in bulk and consumed per packet
+        self._rng = np.random.Generator(np.random.PCG64(seed))
+        self._rng_idx = _RNG_BATCH_SIZE
+        self._loss_buf: List[float] = []
+        self._jitter_buf: List[float] = []
+        self.logger.info("Created network channel '%s'", name)
     
     def start(self) -> None:
-        """Start the channel processing thread."""
+        """Start delivering data sent through the channel."""
+        if self.running:
+            return
         self.running = True
-        self.thread.start()
-        self.logger.info(f"Started network channel '{self.name}'")
+        self._scheduler.acquire()
+        self.logger.info("Started network channel '%s'", self.name)
     
     def stop(self) -> None:
-        """Stop the channel processing thread."""
+        """Stop delivering data sent through the channel."""
+        if not self.running:
+            return
         self.running = False
-        self.thread.join()
-        self.logger.info(f"Stopped network channel '{self.name}'")
+        self._scheduler.release()
+        self.logger.info("Stopped network channel '%s'", self.name)
     
-    def send(self, data: Any, callback: Any) -> None:
+    def send(self, data: Any,
+             callback: Optional[Callable[[Any], None]] = None) -> None:
         """
         Send data through the channel.
         
+        Args:
+            data: Data to send.
+            callback: Callback to call when data arrives. Defaults to
+                the channel's sink.
+        """
+        if callback is None:
+            callback = self._default_sink()
+        key = self.coalesce_key(data) if self.coalesce_key is not None else None
+        self._send(data, callback, key)
+    
+    def send_batch(self, items: List[Any],
+                   callback: Optional[Callable[[Any], None]] = None) -> None:
+        """
+        Send several items through the channel as a single packet.
+        
+        The batch is serialized, scheduled and lost as a unit, and its
+        items are delivered one by one in order. Items superseded by a
+        later item with the same coalescing key are dropped before
+        sending, and undelivered items sent earlier with a key that
+        occurs in the batch are superseded by it. A single item is sent
+        as with send().
+        
+        Args:
+            items: Items to send.
+            callback: Callback to call for each item when the batch
+                arrives. Defaults to the channel's sink.
+        """
+        if callback is None:
+            callback = self._default_sink()
+        keys = ()
+        if self.coalesce_key is not None:
+            seen = set()
+            kept = []
+            for item in reversed(items):
+                key = self.coalesce_key(item)
+                if key is None or key not in seen:
+                    seen.add(key)
+                    kept.append(item)
+            kept.reverse()
+            items = kept
+            seen.discard(None)
+            keys = tuple(seen)
+        if not items:
+            return
+        if len(items) == 1:
+            self.send(items[0], callback)
+            return
+        self._send(list(items), functools.partial(_call_each, callback), None,
+                   keys)
+    
+    def _default_sink(self) -> Callable[[Any], None]:
+        """Return the channel's sink, raising ValueError if it has none."""
+        if self.sink is None:
+            raise ValueError(f"Channel '{self.name}' has no sink")
+        return self.sink
+    
+    def _send(self, data: Any, callback: Callable[[Any], None],
+              key: Optional[Hashable],
+              supersedes: Tuple[Hashable, ...] = ()) -> None:
+        """
+        Serialize data and schedule its delivery.
+        
         Args:
             data: Data to send.
             callback: Callback to call when data arrives.
+            key: Coalescing key of the data, or None.
+            supersedes: Further keys whose undelivered data this data
+                replaces without being registered under them, as for a
+                batch.
         """
-        # Simulate packet loss
-        if random.random() < self.packet_loss:
-            self.logger.debug(f"Packet dropped in channel '{self.name}'")
+        now = self._scheduler.now()
+        
+        # Decide loss before serializing, so dropped packets cost nothing
+        with self._lock:
+            i = self._rng_idx
+            if i >= _RNG_BATCH_SIZE:
+                self._refill_samples()
+                i = 0
+            self._rng_idx = i + 1
+            dropped = self.loss_model.drop(self._loss_buf[i])
+            jitter = self._jitter_buf[i]
+        
+        if dropped:
+            if utils._DEBUG_ENABLED:
+                self.logger.debug("Packet dropped in channel '%s'", self.name)
             return
         
-        # Calculate delivery time based on latency and jitter
-        delivery_time = time.time() + self.latency
-        if self.jitter > 0:
-            delivery_time += random.uniform(-self.jitter/2, self.jitter/2)
+        # Data crosses the channel as bytes, so the receiver gets its own
+        # copy and the payload size determines the transmission time
+        payload = self._encode(data)
+        item = [payload, callback, key]
+        
+        # Delivery time and coalescing in one critical section
+        with self._lock:
+            # Packets are serialized onto the link one after another
+            link_free_at = self._link_free_at
+            if now > link_free_at:
+                link_free_at = now
+            link_free_at += len(payload) * self._tx_time_per_byte
+            self._link_free_at = link_free_at
+            
+            # Calculate delivery time based on latency and jitter
+            delivery_time = link_free_at + self.latency + jitter * self.jitter
+            
+            # Supersede the undelivered item with the same key, which is
+            # skipped when its deadline comes up
+            if key is not None:
+                superseded = self._pending.get(key)
+                if superseded is not None:
+                    superseded[0] = None
+                self._pending[key] = item
+            for other in supersedes:
+                superseded = self._pending.pop(other, None)
+                if superseded is not None:
+                    superseded[0] = None
         
-        # Add to queue
-        self.queue.put((delivery_time, (data, callback)))
-        self.logger.debug(f"Data queued in channel '{self.name}', delivery at {delivery_time}")
+        self._scheduler.schedule(delivery_time, item, self._deliver)
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Data queued in channel '%s', delivery at %f",
+                              self.name, delivery_time)
     
-    def _process_queue(self) -> None:
-        """Process the queue of outgoing messages."""
-        while self.running:
-            try:
-                if self.queue.empty():
-                    time.sleep(0.01)  # Sleep to avoid busy waiting
-                    continue
-                
-                # Peek at the next item
-                delivery_time, _ = self.queue.queue[0]
-                
-                # If it's time to deliver, remove from queue and deliver
-                if time.time() >= delivery_time:
-                    _, (data, callback) = self.queue.get()
-                    callback(data)
-                    self.logger.debug(f"Data delivered in channel '{self.name}'")
-                else:
-                    # Not time yet, sleep a bit
-                    time.sleep(0.01)
-            except Exception as e:
-                self.logger.error(f"Error in channel '{self.name}': {e}")
+    def _deliver(self, item: List[Any]) -> None:
+        """Deserialize a delivered payload and pass it to its callback."""
+        with self._lock:
+            payload, callback, key = item
+            if payload is None:
+                return  # Superseded by newer data with the same key
+            item[0] = None
+            if key is not None and self._pending.get(key) is item:
+                del self._pending[key]
+        callback(self._decode(payload))
+    
+    def _refill_samples(self) -> None:
+        """Draw a new batch of loss and jitter samples."""
+        # Plain lists index faster than ndarrays for per-packet scalar reads
+        self._loss_buf = self._rng.random(_RNG_BATCH_SIZE).tolist()
+        self._jitter_buf = self._draw_jitter(_RNG_BATCH_SIZE).tolist()
+        self._rng_idx = 0
+    
+    def _draw_jitter(self, n: int) -> np.ndarray:
+        """
+        Draw jitter offsets in units of the channel's jitter.
+        
+        Args:
+            n: Number of samples.
+            
+        Returns:
+            Array of offsets. Uniform offsets span [-0.5, 0.5); normal
+            offsets have a standard deviation of 0.5, truncated at
+            three standard deviations; Pareto offsets are zero-mean with
+            a heavy tail of late packets.
+        """
+        dist = self.jitter_distribution
+        if isinstance(dist, np.ndarray):
+            # netem-style table of offsets, sampled with replacement
+            return self._rng.choice(dist, n)
+        if dist == "uniform":
+            return self._rng.uniform(-0.5, 0.5, n)
+        if dist == "pareto":
+            return (self._rng.pareto(_PARETO_SHAPE, n)
+                    - 1.0 / (_PARETO_SHAPE - 1.0)) * 0.5
+        
+        samples = self._rng.standard_normal(n)
+        outliers = np.abs(samples) > _JITTER_TRUNCATION
+        while outliers.any():
+            samples[outliers] = self._rng.standard_normal(int(outliers.sum()))
+            outliers = np.abs(samples) > _JITTER_TRUNCATION
+        return samples * 0.5
     
     def set_conditions(self, latency: float, jitter: float,
-                      packet_loss: float, bandwidth: float) -> None:
+                      packet_loss: float, bandwidth: Optional[float],
+                      loss_model: Optional[Any] = None,
+                      jitter_distribution: Union[str, np.ndarray] = "normal") -> None:
         """
         Set network channel conditions.
         
         Args:
             latency: Base latency in seconds.
             jitter: Jitter in seconds.
-            packet_loss: Packet loss probability (0.0-1.0).
-            bandwidth: Bandwidth limit in bytes per second.
+            packet_loss: Packet loss probability (0.0-1.0), used when no
+                loss model is given.
+            bandwidth: Bandwidth limit in bytes per second, or None for
+                an unlimited link. Must be positive otherwise.
+            loss_model: Loss model such as GilbertElliot. Defaults to
+                independent loss with probability ``packet_loss``.
+            jitter_distribution: One of ``JITTER_DISTRIBUTIONS``, or an
+                array of offsets in units of ``jitter`` to sample from.
+                
+        Raises:
+            ValueError: If the bandwidth is not positive or the jitter
+                distribution is invalid.
         """
+        if bandwidth is not None and not bandwidth > 0:
+            raise ValueError(
+                f"Bandwidth must be positive or None, got {bandwidth}"
+            )
+        if isinstance(jitter_distribution, str):
+            if jitter_distribution not in JITTER_DISTRIBUTIONS:
+                raise ValueError(
+                    f"Unknown jitter distribution '{jitter_distribution}'"
+                )
+        else:
+            jitter_distribution = np.asarray(jitter_distribution, dtype=np.float64)
+            if jitter_distribution.ndim != 1 or jitter_distribution.size == 0:
+                raise ValueError("Jitter table must be a non-empty 1-D array")
+        if loss_model is None:
+            loss_model = RandomLoss(packet_loss)
         self.latency = max(0.0, latency)
         self.jitter = max(0.0, jitter)
-        self.packet_loss = max(0.0, min(1.0, packet_loss))
-        self.bandwidth = max(0.0, bandwidth)
+        with self._lock:
+            self.loss_model = loss_model
+            self.jitter_distribution = jitter_distribution
+            # Discard samples drawn from the previous distribution
+            self._rng_idx = _RNG_BATCH_SIZE
+        self.packet_loss = loss_model.loss_rate
+        self.bandwidth = bandwidth
+        self._tx_time_per_byte = 0.0 if bandwidth is None else 1.0 / bandwidth
         self.logger.info(
-            f"Updated channel '{self.name}' conditions: "
-            f"latency={self.latency:.3f}s, jitter={self.jitter:.3f}s, "
-            f"packet_loss={self.packet_loss:.1%}, bandwidth={self.bandwidth} B/s"
+            "Updated channel '%s' conditions: latency=%.3fs, jitter=%.3fs, "
+            "packet_loss=%.1f%%, bandwidth=%s B/s",
+            self.name, self.latency, self.jitter,
+            self.packet_loss * 100, self.bandwidth
         )
 
 
@@ -129,17 +769,40 @@ class NetworkSimulator(CommunicationInterface):
     the operator and robot, with configurable network conditions.
     """
     
-    def __init__(self):
-        """Initialize the network simulator."""
+    def __init__(self, realtime: bool = True, seed: Optional[int] = None):
+        """
+        Initialize the network simulator.
+        
+        Args:
+            realtime: Deliver data on wall-clock time. If False, data is
+                delivered on a virtual clock moved forward by advance().
+            seed: Seed for the channels' loss and jitter, for
+                reproducible runs.
+        """
         self.logger = get_logger(__name__)
+        self._virtual = None if realtime else _VirtualScheduler()
         
-        # Communication channels
-        self.operator_to_robot = NetworkChannel("operator_to_robot")
-        self.robot_to_operator = NetworkChannel("robot_to_operator")
+        # Command queues, bounded so a slow consumer drops stale data
+        self.command_queue = queue.Queue(maxsize=_RECEIVE_QUEUE_SIZE)
+        self.state_queue = queue.Queue(maxsize=_RECEIVE_QUEUE_SIZE)
         
-        # Command queues
-        self.command_queue = queue.Queue()
-        self.state_queue = queue.Queue()
+        # Socket pair signalled on every delivery, so consumers can wait
+        # for data with select instead of polling the queues
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._wakeup_w.setblocking(False)
+        self._wakeup_pending = False
+        
+        # Communication channels deliver into the queues
+        self.operator_to_robot = NetworkChannel(
+            "operator_to_robot", functools.partial(self._put, self.command_queue),
+            seed=seed, scheduler=self._virtual, coalesce_key=command_coalesce_key,
+            encode=_encode_command_payload, decode=Command.decode
+        )
+        self.robot_to_operator = NetworkChannel(
+            "robot_to_operator", functools.partial(self._put, self.state_queue),
+            seed=None if seed is None else seed + 1, scheduler=self._virtual
+        )
         
         # Start channels
         self.operator_to_robot.start()
@@ -147,42 +810,143 @@ class NetworkSimulator(CommunicationInterface):
         
         self.logger.info("Network simulator initialized")
     
+    def _put(self, q: queue.Queue, item: Any) -> None:
+        """Queue a delivered item and signal the wakeup socket."""
+        put_overwrite(q, item)
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            try:
+                self._wakeup_w.send(b"\0")
+            except OSError:
+                pass  # Buffer full or closed; a wakeup is already pending
+    
+    def readable_fd(self) -> int:
+        """
+        File descriptor that becomes readable when data is delivered.
+        
+        Register it with a selector to wait for either a deadline or
+        incoming data. Call clear_wakeup() before draining the queues.
+        
+        Returns:
+            File descriptor of the wakeup socket.
+        """
+        return self._wakeup_r.fileno()
+    
+    def clear_wakeup(self) -> None:
+        """
+        Reset the wakeup socket so it is readable again only on new data.
+        
+        Call this before draining the queues. The socket is drained before
+        the pending flag is cleared: a delivery landing in between finds
+        the flag still set and writes nothing, but its item is already
+        queued for the drain that follows.
+        """
+        try:
+            while self._wakeup_r.recv(4096):
+                pass
+        except OSError:
+            pass
+        self._wakeup_pending = False
+    
+    @property
+    def virtual_clock(self) -> float:
+        """Current virtual time in seconds (non-realtime mode only)."""
+        if self._virtual is None:
+            raise RuntimeError("Network simulator is running in realtime mode")
+        return self._virtual.time
+    
+    def advance(self, dt: float) -> None:
+        """
+        Advance the virtual clock, delivering all data now due.
+        
+        Args:
+            dt: Time to advance in seconds.
+            
+        Raises:
+            RuntimeError: If the simulator is running in realtime mode.
+        """
+        if self._virtual is None:
+            raise RuntimeError("Network simulator is running in realtime mode")
+        self._virtual.advance(dt)
+    
     def set_network_conditions(self, latency: float, 
                                packet_loss: float, 
-                               bandwidth: float) -> None:
+                               bandwidth: Optional[float],
+                               loss_model: Optional[Any] = None,
+                               jitter: Optional[float] = None,
+                               jitter_distribution: Union[str, np.ndarray] = "normal") -> None:
         """
         Set network condition parameters for simulation.
         
         Args:
             latency: Latency in seconds.
             packet_loss: Packet loss probability (0.0-1.0).
-            bandwidth: Bandwidth limit in bytes per second.
+            bandwidth: Bandwidth limit in bytes per second, or None for
+                an unlimited link.
+            loss_model: Optional loss model such as
+                ``GilbertElliot.wifi()``, overriding ``packet_loss``.
+                Each channel gets its own copy.
+            jitter: Jitter in seconds. Defaults to 10% of latency.
+            jitter_distribution: Jitter distribution name or table, see
+                ``NetworkChannel.set_conditions``.
         """
-        # Set jitter to 10% of latency as a reasonable default
-        jitter = latency * 0.1
+        if jitter is None:
+            # Set jitter to 10% of latency as a reasonable default
+            jitter = latency * 0.1
         
         # Set conditions for both channels
         self.operator_to_robot.set_conditions(
-            latency, jitter, packet_loss, bandwidth
+            latency, jitter, packet_loss, bandwidth, copy.copy(loss_model),
+            jitter_distribution
         )
         self.robot_to_operator.set_conditions(
-            latency, jitter, packet_loss, bandwidth
+            latency, jitter, packet_loss, bandwidth, copy.copy(loss_model),
+            jitter_distribution
         )
     
-    def send_command(self, command: Command) -> None:
+    def set_network_preset(self, name: str) -> None:
         """
-        Send a command from operator to robot.
+        Set network conditions from a named preset.
         
         Args:
-            command: Command to send.
+            name: Name of a preset in ``NETWORK_PRESETS``, such as
+                ``"wifi"`` or ``"satellite"``.
+        """
+        preset = NETWORK_PRESETS.get(name)
+        if preset is None:
+            raise ValueError(f"Unknown network preset '{name}'")
+        loss_model = preset["loss_model"]()
+        self.set_network_conditions(
+            latency=preset["latency"],
+            packet_loss=loss_model.loss_rate,
+            bandwidth=preset["bandwidth"],
+            loss_model=loss_model,
+            jitter=preset["jitter"],
+            jitter_distribution=preset["jitter_distribution"]
+        )
+    
+    def send_command(self, command: Union[Command, bytes]) -> None:
         """
-        self.logger.debug(f"Sending command: {command.type}")
+        Send a command from operator to robot.
         
-        def command_callback(data: Command) -> None:
-            self.command_queue.put(data)
-            self.logger.debug("Command received at robot")
+        Args:
+            command: Command to send, or a command already encoded with
+                Command.encode().
+        """
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Sending command: %s", getattr(command, "type", "<encoded>"))
+        self.operator_to_robot.send(command)
+    
+    def send_commands(self, commands: List[Command]) -> None:
+        """
+        Send several commands from operator to robot as one packet.
         
-        self.operator_to_robot.send(command, command_callback)
+        Args:
+            commands: Commands to send, in order.
+        """
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Sending %d commands", len(commands))
+        self.operator_to_robot.send_batch(commands)
     
     def receive_command(self) -> Optional[Command]:
         """
@@ -196,6 +960,29 @@ class NetworkSimulator(CommunicationInterface):
         except queue.Empty:
             return None
     
+    def receive_commands(self, max_items: int = _RECEIVE_QUEUE_SIZE) -> List[Command]:
+        """
+        Receive all queued commands sent to the robot.
+        
+        Args:
+            max_items: Maximum number of commands to receive.
+            
+        Returns:
+            Queued commands in arrival order, possibly empty.
+        """
+        return drain(self.command_queue, max_items)
+    
+    def receive_latest_command(self) -> Optional[Command]:
+        """
+        Receive only the newest command sent to the robot.
+        
+        Older queued commands are discarded.
+        
+        Returns:
+            Newest command in the queue, or None if queue is empty.
+        """
+        return pop_latest(self.command_queue)
+    
     def send_state(self, state: RobotState) -> None:
         """
         Send robot state to the operator.
@@ -203,13 +990,20 @@ class NetworkSimulator(CommunicationInterface):
         Args:
             state: Robot state to send.
         """
-        self.logger.debug("Sending robot state")
-        
-        def state_callback(data: RobotState) -> None:
-            self.state_queue.put(data)
-            self.logger.debug("State received at operator")
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Sending robot state")
+        self.robot_to_operator.send(state)
+    
+    def send_states(self, states: List[RobotState]) -> None:
+        """
+        Send several robot states to the operator as one packet.
         
-        self.robot_to_operator.send(state, state_callback)
+        Args:
+            states: Robot states to send, in order.
+        """
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Sending %d robot states", len(states))
+        self.robot_to_operator.send_batch(states)
     
     def receive_state(self) -> Optional[RobotState]:
         """
@@ -223,8 +1017,33 @@ class NetworkSimulator(CommunicationInterface):
         except queue.Empty:
             return None
     
+    def receive_states(self, max_items: int = _RECEIVE_QUEUE_SIZE) -> List[RobotState]:
+        """
+        Receive all queued robot states at the operator side.
+        
+        Args:
+            max_items: Maximum number of states to receive.
+            
+        Returns:
+            Queued states in arrival order, possibly empty.
+        """
+        return drain(self.state_queue, max_items)
+    
+    def receive_latest_state(self) -> Optional[RobotState]:
+        """
+        Receive only the newest robot state at the operator side.
+        
+        Older queued states are discarded.
+        
+        Returns:
+            Newest state in the queue, or None if queue is empty.
+        """
+        return pop_latest(self.state_queue)
+    
     def shutdown(self) -> None:
         """Stop the network simulator."""
         self.operator_to_robot.stop()
         self.robot_to_operator.stop()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
         self.logger.info("Network simulator stopped") 
\ No newline at end of file
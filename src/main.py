@@ -9,22 +9,27 @@ import argparse
 import logging
 import sys
 import os
+import selectors
 import time
-from typing import Dict, Any
+from collections import deque
+from typing import Deque, Dict, Any
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 from src.common.interfaces import (
-    Command, Pose, Vector3, Quaternion
+    IDENTITY_QUAT, Command, Pose, Vector3
 )
-from src.common.utils import get_logger
+from src.common.utils import DeadlineSleeper, configure_logging, get_logger
 
 from src.simulation.simulator import Simulator
 from src.robots.robot_model import Arm6DOF
 from src.operator.ui import OperatorUI
 from src.communication.network import NetworkSimulator
 
+# Maximum number of operator input events processed per tick
+MAX_INPUTS_PER_TICK = 32
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -63,8 +68,15 @@ def parse_args():
     parser.add_argument(
         "--bandwidth",
         type=float,
-        default=float('inf'),
-        help="Network bandwidth in bytes per second"
+        default=None,
+        help="Network bandwidth in bytes per second (default: unlimited)"
+    )
+    
+    parser.add_argument(
+        "--batch-ticks",
+        type=int,
+        default=1,
+        help="Number of ticks whose network messages are sent as one batch"
     )
     
     parser.add_argument(
@@ -84,10 +96,7 @@ def main():
     args = parse_args()
     
     # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    configure_logging(getattr(logging, args.log_level))
     logger = get_logger(__name__)
     
     logger.info("Starting teleoperation simulation")
@@ -102,7 +111,7 @@ def main():
     # Add robot to simulation
     robot_pose = Pose(
         position=Vector3(x=0.0, y=0.0, z=0.5),
-        orientation=Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
+        orientation=IDENTITY_QUAT
     )
     simulator.add_robot(robot_id, args.robot_type, robot_pose)
     
@@ -119,54 +128,83 @@ def main():
     operator = OperatorUI(robot_id, args.ui_mode)
     logger.info("Operator UI initialized")
     
-    # Example input data
+    # Operator input events. Input callbacks (keyboard, joystick) append
+    # here, possibly from their own threads; deque appends are atomic.
+    # The demo replays a single key press.
     example_input = {
         "type": "keyboard",
         "key": "w"
     }
+    input_queue: Deque[Dict[str, Any]] = deque([example_input])
+    
+    # Wake on incoming data as well as on tick deadlines
+    selector = selectors.DefaultSelector()
+    selector.register(network.readable_fd(), selectors.EVENT_READ)
     
     try:
-        # Main simulation loop
-        dt = 0.01  # 10ms timestep
-        last_time = time.time()
+        # Main simulation loop. Tick n is due at start + n * dt; deadlines
+        # advance by dt rather than being reset from the clock, so wake-up
+        # errors do not accumulate as drift. Deadlines are kept in integer
+        # nanoseconds so the accumulation itself is exact.
+        dt_ns = 10_000_000  # 10ms timestep
+        dt = dt_ns * 1e-9
+        sleeper = DeadlineSleeper()
+        next_tick_ns = time.perf_counter_ns()
+        
+        # Outgoing messages are sent as one batch every batch_ticks ticks
+        batch_ticks = max(1, args.batch_ticks)
+        pending_commands = []
+        pending_states = []
+        tick = 0
         
         while True:
-            current_time = time.time()
-            elapsed = current_time - last_time
+            # Apply commands as soon as they arrive while waiting for the
+            # next tick
+            while sleeper.wait_until(next_tick_ns * 1e-9, selector):
+                network.clear_wakeup()
+                for robot_command in network.receive_commands():
+                    simulator.apply_command(robot_id, robot_command)
+            next_tick_ns += dt_ns
+            current_time = time.perf_counter()
+            tick += 1
+            
+            # Step simulation
+            simulator.step(dt)
             
-            if elapsed >= dt:
-                # Step simulation
-                simulator.step(elapsed)
-                last_time = current_time
-                
-                # Process operator input
-                command = operator.process_input(example_input)
+            # Process the operator input that arrived since the last tick
+            for _ in range(min(len(input_queue), MAX_INPUTS_PER_TICK)):
+                command = operator.process_input(input_queue.popleft(),
+                                                 current_time)
                 if command:
-                    network.send_command(command)
-                
-                # Process commands at robot
-                robot_command = network.receive_command()
-                if robot_command:
-                    simulator.apply_command(robot_id, robot_command)
-                
-                # Get robot state
-                robot_state = simulator.get_robot_state(robot_id)
-                
-                # Send state to operator
-                network.send_state(robot_state)
-                
-                # Update operator display
-                operator_state = network.receive_state()
-                if operator_state:
-                    operator.update_display(operator_state)
+                    pending_commands.append(command)
+            if not input_queue:
+                input_queue.append(example_input)
+            
+            # Process commands at robot
+            for robot_command in network.receive_commands():
+                simulator.apply_command(robot_id, robot_command)
+            
+            # Get robot state
+            pending_states.append(simulator.get_robot_state(robot_id))
+            
+            # Send pending commands and states
+            if tick % batch_ticks == 0:
+                if pending_commands:
+                    network.send_commands(pending_commands)
+                    pending_commands.clear()
+                network.send_states(pending_states)
+                pending_states.clear()
             
-            # Sleep to avoid busy waiting
-            time.sleep(0.001)
+            # Update operator display
+            operator_state = network.receive_latest_state()
+            if operator_state:
+                operator.update_display(operator_state)
             
     except KeyboardInterrupt:
         logger.info("Simulation interrupted")
     finally:
-        # Clean up
+        # Clean up; the selector goes before the wakeup socket it watches
+        selector.close()
         network.shutdown()
         logger.info("Simulation ended")
 
@@ -6,16 +6,21 @@ interface used by human operators.
 """
 
 import time
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 import numpy as np
 
 from src.common.interfaces import (
-    Command, OperatorInterface, RobotState
+    CmdType, Command, OperatorInterface, RobotState
 )
+from src.common import utils
 from src.common.utils import get_logger, throttle
 
 
+# Module logger
+_LOG = get_logger(__name__)
+
+
 class OperatorUI(OperatorInterface):
     """
     Operator user interface implementation.
@@ -24,6 +29,15 @@ class OperatorUI(OperatorInterface):
     and feedback for the human operator.
     """
     
+    # Keyboard mapping from key to (linear, angular) velocity
+    _KEY_TABLE: Dict[str, Tuple[float, float]] = {
+        "w": (0.5, 0.0),  # Forward
+        "s": (-0.5, 0.0),  # Backward
+        "a": (0.0, 0.5),  # Turn left
+        "d": (0.0, -0.5),  # Turn right
+    }
+    _VELOCITY_TYPE = CmdType.VELOCITY
+    
     def __init__(self, robot_id: str, ui_mode: str = "simple"):
         """
         Initialize the operator UI.
@@ -32,21 +46,29 @@ class OperatorUI(OperatorInterface):
             robot_id: ID of the robot being controlled.
             ui_mode: UI mode ("simple", "advanced", "vr").
         """
-        self.logger = get_logger(__name__)
         self.robot_id = robot_id
         self.ui_mode = ui_mode
         self.current_robot_state: Optional[RobotState] = None
         self.input_handlers: Dict[str, Any] = {}
         self.display_components: Dict[str, Any] = {}
+        # Update methods of the active display components, in order
+        self._updaters: Tuple[Callable[[RobotState], None], ...] = ()
+        # Last keyboard command, reused while the same key is repeated
+        self._last_input_key: Optional[str] = None
+        self._last_command: Optional[Command] = None
         self._initialize_ui()
-        self.logger.info(f"Operator UI initialized in {ui_mode} mode for robot {robot_id}")
+        self._updaters = tuple(
+            getattr(self, f"_update_{name}") for name in self.display_components
+        )
+        _LOG.info("Operator UI initialized in %s mode for robot %s",
+                  ui_mode, robot_id)
     
     def _initialize_ui(self) -> None:
         """Initialize UI components based on mode."""
         # In a real implementation, this would set up the UI components
         # like displays, input handlers, etc.
         if self.ui_mode == "simple":
-            self.logger.info("Initializing simple UI mode")
+            _LOG.info("Initializing simple UI mode")
             # Simple keyboard/mouse input
             self.input_handlers = {
                 "keyboard": self._handle_keyboard_input,
@@ -58,7 +80,7 @@ class OperatorUI(OperatorInterface):
                 "status_panel": {}
             }
         elif self.ui_mode == "advanced":
-            self.logger.info("Initializing advanced UI mode")
+            _LOG.info("Initializing advanced UI mode")
             # Advanced input with joystick
             self.input_handlers = {
                 "keyboard": self._handle_keyboard_input,
@@ -73,7 +95,7 @@ class OperatorUI(OperatorInterface):
                 "joint_view": {}
             }
         elif self.ui_mode == "vr":
-            self.logger.info("Initializing VR UI mode")
+            _LOG.info("Initializing VR UI mode")
             # VR input
             self.input_handlers = {
                 "vr_controller_left": self._handle_vr_controller_input,
@@ -85,77 +107,73 @@ class OperatorUI(OperatorInterface):
                 "vr_view": {}
             }
     
-    def process_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    def process_input(self, input_data: Dict[str, Any],
+                      now: Optional[float] = None) -> Optional[Command]:
         """
         Process operator input and generate command.
         
         Args:
             input_data: Input data from the operator.
+            now: Time used to stamp generated commands, typically the
+                caller's per-tick time. Defaults to ``time.perf_counter()``.
             
         Returns:
             Command to send to the robot, or None if no command should be sent.
         """
-        self.logger.debug(f"Processing input: {input_data}")
+        if utils._DEBUG_ENABLED:
+            _LOG.debug("Processing input: %r", input_data)
         
         input_type = input_data.get("type")
         if not input_type:
-            self.logger.warning("Input data missing 'type' field")
+            _LOG.warning("Input data missing 'type' field")
             return None
             
         handler = self.input_handlers.get(input_type)
         if not handler:
-            self.logger.warning(f"No handler for input type '{input_type}'")
+            _LOG.warning("No handler for input type '%s'", input_type)
             return None
             
-        return handler(input_data)
+        if now is None:
+            now = time.perf_counter()
+        return handler(input_data, now)
     
-    def _handle_keyboard_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    def _handle_keyboard_input(self, input_data: Dict[str, Any],
+                               now: float) -> Optional[Command]:
         """
         Handle keyboard input.
         
         Args:
             input_data: Keyboard input data.
+            now: Time used to stamp generated commands.
             
         Returns:
             Command generated from keyboard input.
         """
         key = input_data.get("key")
-        if not key:
+        last = self._last_command
+        if last is not None and key == self._last_input_key:
+            # Velocity commands are stateless, so a repeated key shares
+            # the previous command's data
+            return Command(last.type, last.data, now)
+        
+        entry = self._KEY_TABLE.get(key)
+        if entry is None:
             return None
-            
-        # Simple keyboard mapping example
-        if key == "w":  # Forward
-            return Command(
-                type="velocity",
-                data={"linear": 0.5, "angular": 0.0},
-                timestamp=time.time()
-            )
-        elif key == "s":  # Backward
-            return Command(
-                type="velocity",
-                data={"linear": -0.5, "angular": 0.0},
-                timestamp=time.time()
-            )
-        elif key == "a":  # Turn left
-            return Command(
-                type="velocity",
-                data={"linear": 0.0, "angular": 0.5},
-                timestamp=time.time()
-            )
-        elif key == "d":  # Turn right
-            return Command(
-                type="velocity",
-                data={"linear": 0.0, "angular": -0.5},
-                timestamp=time.time()
-            )
-        return None
+        linear, angular = entry
+        command = Command(self._VELOCITY_TYPE,
+                          {"linear": linear, "angular": angular}, now)
+        self._last_input_key = key
+        self._last_command = command
+        return command
     
-    def _handle_mouse_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    def _handle_mouse_input(self, input_data: Dict[str, Any],
+                            now: float) -> Optional[Command]:
         """
         Handle mouse input.
         
         Args:
             input_data: Mouse input data.
+            now: Time used to stamp generated commands.
             
         Returns:
             Command generated from mouse input.
@@ -164,12 +182,14 @@ class OperatorUI(OperatorInterface):
         # and clicks to generate robot commands
         return None
     
-    def _handle_joystick_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    def _handle_joystick_input(self, input_data: Dict[str, Any],
+                               now: float) -> Optional[Command]:
         """
         Handle joystick input.
         
         Args:
             input_data: Joystick input data.
+            now: Time used to stamp generated commands.
             
         Returns:
             Command generated from joystick input.
@@ -178,12 +198,14 @@ class OperatorUI(OperatorInterface):
         # and buttons to generate robot commands
         return None
     
-    def _handle_vr_controller_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    def _handle_vr_controller_input(self, input_data: Dict[str, Any],
+                                    now: float) -> Optional[Command]:
         """
         Handle VR controller input.
         
         Args:
             input_data: VR controller input data.
+            now: Time used to stamp generated commands.
             
         Returns:
             Command generated from VR controller input.
@@ -192,12 +214,14 @@ class OperatorUI(OperatorInterface):
         # pose and buttons to generate robot commands
         return None
     
-    def _handle_vr_headset_input(self, input_data: Dict[str, Any]) -> Optional[Command]:
+    def _handle_vr_headset_input(self, input_data: Dict[str, Any],
+                                 now: float) -> Optional[Command]:
         """
         Handle VR headset input.
         
         Args:
             input_data: VR headset input data.
+            now: Time used to stamp generated commands.
             
         Returns:
             Command generated from VR headset input.
@@ -213,27 +237,16 @@ class OperatorUI(OperatorInterface):
         Args:
             robot_state: Current robot state.
         """
+        if robot_state is self.current_robot_state:
+            return  # Already displayed
         self.current_robot_state = robot_state
-        self.logger.debug("Updating display with new robot state")
+        if utils._DEBUG_ENABLED:
+            _LOG.debug("Updating display with new robot state")
         
         # In a real implementation, this would update all display components
         # with the new robot state
-        
-        # Example of how to update different display components
-        if "robot_view" in self.display_components:
-            self._update_robot_view(robot_state)
-        
-        if "status_panel" in self.display_components:
-            self._update_status_panel(robot_state)
-        
-        if "camera_view" in self.display_components:
-            self._update_camera_view(robot_state)
-        
-        if "joint_view" in self.display_components:
-            self._update_joint_view(robot_state)
-        
-        if "vr_view" in self.display_components:
-            self._update_vr_view(robot_state)
+        for update in self._updaters:
+            update(robot_state)
     
     def _update_robot_view(self, robot_state: RobotState) -> None:
         """Update the robot visualization."""
@@ -7,4 +7,5 @@ and control interfaces for various robot types.
 
 __version__ = "0.1.0"
 # Explicitly expose module contents
-from src.robots.robot_model import Arm6DOF, BaseRobot 
\ No newline at end of file
+from src.robots.robot_model import Arm6DOF, BaseRobot
+from src.robots.workspace import WorkspaceFilter 
\ No newline at end of file
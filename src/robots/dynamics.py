@@ -0,0 +1,26 @@
+"""
+Joint dynamics integration.
+
+This module advances joint state arrays in place. It works on the
+structure-of-arrays joint storage of the robot models, so a step is a
+couple of vectorized operations regardless of the number of joints.
+"""
+
+import numpy as np
+
+
+def step_joints(positions: np.ndarray, velocities: np.ndarray,
+                efforts: np.ndarray, dt: float) -> None:
+    """
+    Advance joint states by one semi-implicit Euler step, in place.
+
+    Efforts are treated as accelerations of unit-inertia joints.
+
+    Args:
+        positions: Joint positions, updated in place.
+        velocities: Joint velocities, updated in place.
+        efforts: Joint efforts.
+        dt: Time step in seconds.
+    """
+    velocities += efforts * dt
+    positions += velocities * dt
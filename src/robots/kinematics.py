@@ -0,0 +1,126 @@
+"""
+Serial manipulator kinematics.
+
+This module provides forward and inverse kinematics for serial arms
+described by standard Denavit-Hartenberg parameters. All functions work
+on flat float64 arrays so they can be called every tick without
+building intermediate objects.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from src.common.utils import rotation_matrix_to_quaternion
+
+
+# Standard DH parameters of the 6-DOF arm (UR5 geometry), in meters and
+# radians
+ARM6_DH_A = np.array([0.0, -0.425, -0.39225, 0.0, 0.0, 0.0])
+ARM6_DH_ALPHA = np.array([math.pi / 2, 0.0, 0.0, math.pi / 2, -math.pi / 2, 0.0])
+ARM6_DH_D = np.array([0.089159, 0.0, 0.0, 0.10915, 0.09465, 0.0823])
+
+
+def _chain(q: np.ndarray, dh_a: np.ndarray, dh_alpha: np.ndarray,
+           dh_d: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Walk the kinematic chain.
+
+    Args:
+        q: Joint positions in radians.
+        dh_a: Link lengths.
+        dh_alpha: Link twists.
+        dh_d: Link offsets.
+
+    Returns:
+        Tuple of the joint axes (n x 3) and origins (n x 3) of the frames
+        preceding each joint, and the end-effector transform (4 x 4).
+    """
+    n = q.shape[0]
+    axes = np.empty((n, 3))
+    origins = np.empty((n, 3))
+    t = np.eye(4)
+    link = np.zeros((4, 4))
+    link[3, 3] = 1.0
+    for i in range(n):
+        axes[i] = t[:3, 2]
+        origins[i] = t[:3, 3]
+        ct, st = math.cos(q[i]), math.sin(q[i])
+        ca, sa = math.cos(dh_alpha[i]), math.sin(dh_alpha[i])
+        link[0, 0], link[0, 1], link[0, 2], link[0, 3] = ct, -st * ca, st * sa, dh_a[i] * ct
+        link[1, 0], link[1, 1], link[1, 2], link[1, 3] = st, ct * ca, -ct * sa, dh_a[i] * st
+        link[2, 1], link[2, 2], link[2, 3] = sa, ca, dh_d[i]
+        t = t @ link
+    return axes, origins, t
+
+
+def fk6(q: np.ndarray, dh_a: np.ndarray = ARM6_DH_A,
+        dh_alpha: np.ndarray = ARM6_DH_ALPHA,
+        dh_d: np.ndarray = ARM6_DH_D) -> np.ndarray:
+    """
+    Compute the end-effector pose of a serial arm.
+
+    Args:
+        q: Joint positions in radians.
+        dh_a: Link lengths.
+        dh_alpha: Link twists.
+        dh_d: Link offsets.
+
+    Returns:
+        7-element array of the position (x, y, z) followed by the
+        orientation quaternion (w, x, y, z), in the arm base frame.
+    """
+    _, _, t = _chain(q, dh_a, dh_alpha, dh_d)
+    out = np.empty(7)
+    out[:3] = t[:3, 3]
+    out[3:] = rotation_matrix_to_quaternion(t[:3, :3])
+    return out
+
+
+def ik6_dls(target: np.ndarray, q0: np.ndarray,
+            dh_a: np.ndarray = ARM6_DH_A,
+            dh_alpha: np.ndarray = ARM6_DH_ALPHA,
+            dh_d: np.ndarray = ARM6_DH_D,
+            damping: float = 0.05, tol: float = 1e-4,
+            max_iter: int = 100) -> Tuple[np.ndarray, bool]:
+    """
+    Solve position inverse kinematics with damped least squares.
+
+    Only the end-effector position is matched; the redundant degrees of
+    freedom stay close to the seed, which keeps successive teleoperation
+    solutions continuous.
+
+    Args:
+        target: Target position (x, y, z) in the arm base frame.
+        q0: Seed joint positions in radians.
+        dh_a: Link lengths.
+        dh_alpha: Link twists.
+        dh_d: Link offsets.
+        damping: Damping factor, trading accuracy near singularities for
+            bounded joint steps.
+        tol: Position tolerance in meters.
+        max_iter: Maximum number of iterations.
+
+    Returns:
+        Tuple of the joint positions, wrapped to [-pi, pi), and whether
+        the tolerance was met.
+    """
+    q = np.array(q0, dtype=np.float64)
+    lam2 = damping * damping
+    for _ in range(max_iter):
+        axes, origins, t = _chain(q, dh_a, dh_alpha, dh_d)
+        err = target - t[:3, 3]
+        if err @ err < tol * tol:
+            return _wrap_angles(q), True
+        # Position rows of the geometric Jacobian of revolute joints
+        jac = np.cross(axes, t[:3, 3] - origins).T
+        q += jac.T @ np.linalg.solve(jac @ jac.T + lam2 * np.eye(3), err)
+    _, _, t = _chain(q, dh_a, dh_alpha, dh_d)
+    err = target - t[:3, 3]
+    return _wrap_angles(q), bool(err @ err < tol * tol)
+
+
+def _wrap_angles(q: np.ndarray) -> np.ndarray:
+    """Wrap joint angles to [-pi, pi), so warm-started solves stay bounded."""
+    return np.remainder(q + math.pi, 2.0 * math.pi) - math.pi
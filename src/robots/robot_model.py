@@ -6,14 +6,54 @@ shared by different robot types.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from src.common.interfaces import (
-    Command, JointState, Pose, RobotInterface, RobotState, Vector3, Quaternion
+    IDENTITY_QUAT, CmdType, Command, JointState, Pose, RobotInterface, RobotState,
+    RobotStateArrays, Vector3, Quaternion
 )
+from src.common import utils
 from src.common.utils import get_logger
+from src.robots.dynamics import step_joints
+from src.robots.kinematics import ARM6_DH_A, ARM6_DH_D, fk6, ik6_dls
+from src.robots.workspace import WorkspaceFilter
+
+
+# Module logger, shared by all robot instances
+_LOG = get_logger(__name__)
+
+# Link lengths of the 6-DOF arm in meters. Each DH link translates by d
+# along the previous z axis and a along the new x axis, which are
+# orthogonal.
+ARM6_LINK_LENGTHS = np.hypot(ARM6_DH_A, ARM6_DH_D)
+
+
+@dataclass(frozen=True)
+class RobotSpec:
+    """Joint layout and default pose of a robot type."""
+    joint_names: Tuple[str, ...]
+    default_pose: Pose
+
+
+# Joint names of the supported robot types
+_ARM6_NAMES = ("joint1", "joint2", "joint3", "joint4", "joint5", "joint6")
+_MOBILE_NAMES = ("left_wheel", "right_wheel")
+
+# Specs of the supported robot types. Poses are immutable, so robots of
+# the same type share their default pose.
+_ROBOT_SPECS: Dict[str, RobotSpec] = {
+    "arm_6dof": RobotSpec(
+        _ARM6_NAMES,
+        Pose(position=Vector3(x=0.0, y=0.0, z=0.5), orientation=IDENTITY_QUAT)
+    ),
+    "mobile_platform": RobotSpec(
+        _MOBILE_NAMES,
+        Pose(position=Vector3(x=0.0, y=0.0, z=0.1), orientation=IDENTITY_QUAT)
+    ),
+}
 
 
 class BaseRobot(RobotInterface):
@@ -31,13 +71,23 @@ class BaseRobot(RobotInterface):
         Args:
             name: Name of the robot instance.
         """
-        self.logger = get_logger(__name__)
         self.name = name
-        self.joint_states: List[JointState] = []
+        # Joint state is stored as parallel arrays indexed like joint_names
+        self.joint_names: Tuple[str, ...] = ()
+        self._joints = np.zeros((3, 0))
+        # Last state returned by get_state and the joint values it was
+        # built from
+        self._state: Optional[RobotState] = None
+        self._state_joints = self._joints.copy()
         self.pose: Optional[Pose] = None
         self.robot_type = "generic"
         self.initialized = False
-        self.logger.info(f"Created robot '{name}'")
+        # Command handlers indexed by CmdType
+        self._cmd_handlers = [None] * len(CmdType)
+        self._cmd_handlers[CmdType.JOINT_POSITION] = self._apply_joint_position_command
+        self._cmd_handlers[CmdType.VELOCITY] = self._apply_velocity_command
+        self._cmd_handlers[CmdType.CARTESIAN] = self._apply_cartesian_command
+        _LOG.info("Created robot '%s'", name)
     
     def initialize(self, robot_type: str) -> None:
         """
@@ -49,106 +99,181 @@ class BaseRobot(RobotInterface):
         self.robot_type = robot_type
         self._setup_joints()
         self.initialized = True
-        self.logger.info(f"Initialized robot '{self.name}' as {robot_type}")
+        _LOG.info("Initialized robot '%s' as %s", self.name, robot_type)
     
     def _setup_joints(self) -> None:
         """Set up joint states based on robot type."""
-        if self.robot_type == "arm_6dof":
-            # Example 6DOF arm joint setup
-            self.joint_states = [
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="joint1"),
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="joint2"),
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="joint3"),
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="joint4"),
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="joint5"),
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="joint6"),
-            ]
-            # Default pose
-            self.pose = Pose(
-                position=Vector3(x=0.0, y=0.0, z=0.5),
-                orientation=Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
-            )
-        elif self.robot_type == "mobile_platform":
-            # Example mobile platform joint setup
-            self.joint_states = [
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="left_wheel"),
-                JointState(position=0.0, velocity=0.0, effort=0.0, name="right_wheel"),
-            ]
-            # Default pose
-            self.pose = Pose(
-                position=Vector3(x=0.0, y=0.0, z=0.1),
-                orientation=Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
-            )
-        else:
-            self.logger.warning(f"Unknown robot type: {self.robot_type}")
+        spec = _ROBOT_SPECS.get(self.robot_type)
+        if spec is None:
+            _LOG.warning("Unknown robot type: %s", self.robot_type)
+            return
+        self._allocate_joints(spec.joint_names)
+        self.pose = spec.default_pose
+    
+    def _allocate_joints(self, names: Tuple[str, ...]) -> None:
+        """
+        Allocate zeroed joint state arrays.
+        
+        Args:
+            names: Joint names, in array order.
+        """
+        self.joint_names = names
+        # One allocation; the rows are exposed as positions, velocities
+        # and efforts
+        self._joints = np.zeros((3, len(names)))
+        self._state = None
+        self._state_joints = self._joints.copy()
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """Joint positions, a view to be modified in place."""
+        return self._joints[0]
+    
+    @property
+    def velocities(self) -> np.ndarray:
+        """Joint velocities, a view to be modified in place."""
+        return self._joints[1]
+    
+    @property
+    def efforts(self) -> np.ndarray:
+        """Joint efforts, a view to be modified in place."""
+        return self._joints[2]
+    
+    @property
+    def joint_states(self) -> List[JointState]:
+        """Joint states built from the joint arrays."""
+        return [
+            JointState(position=p, velocity=v, effort=e, name=name)
+            for p, v, e, name in zip(self.positions.tolist(),
+                                     self.velocities.tolist(),
+                                     self.efforts.tolist(),
+                                     self.joint_names)
+        ]
     
     def get_state(self) -> RobotState:
         """
         Get the current state of the robot.
         
+        States are immutable, so while the robot has not moved the
+        previously returned state is returned again.
+        
         Returns:
             Current robot state.
         """
         if not self.initialized:
-            self.logger.warning("Getting state of uninitialized robot")
+            _LOG.warning("Getting state of uninitialized robot")
+        
+        state = self._state
+        if (state is None or state.pose is not self.pose
+                or not np.array_equal(self._joints, self._state_joints)):
+            state = RobotState(
+                joint_states=self.joint_states,
+                pose=self.pose,
+                timestamp=0.0  # In a real implementation, this would be the current time
+            )
+            np.copyto(self._state_joints, self._joints)
+            self._state = state
+        return state
+    
+    def get_state_arrays(self) -> RobotStateArrays:
+        """
+        Get the current state of the robot in structure-of-arrays form.
+        
+        Unlike get_state, this copies the joint arrays directly without
+        building a JointState per joint.
         
-        return RobotState(
-            joint_states=self.joint_states,
-            pose=self.pose,
-            timestamp=0.0  # In a real implementation, this would be the current time
+        Returns:
+            Current robot state.
+        """
+        pose = self.pose
+        return RobotStateArrays(
+            positions=self.positions.copy(),
+            velocities=self.velocities.copy(),
+            efforts=self.efforts.copy(),
+            names=self.joint_names,
+            pose_position=pose.position.to_array_copy() if pose else None,
+            pose_orientation=pose.orientation.to_array_copy() if pose else None,
+            timestamp=0.0
         )
     
-    def apply_command(self, command: Command) -> None:
+    def apply_command(self, command: Command,
+                      seed: Optional[np.ndarray] = None) -> None:
         """
         Apply a command to the robot.
         
         Args:
             command: Command to apply.
+            seed: Initial joint positions for inverse kinematics.
         """
         if not self.initialized:
-            self.logger.warning("Applying command to uninitialized robot")
+            _LOG.warning("Applying command to uninitialized robot")
             return
         
-        self.logger.info(f"Applying command of type {command.type}")
+        if utils._DEBUG_ENABLED:
+            _LOG.debug("Applying command of type %s", command.type)
         
-        if command.type == "joint_position":
-            self._apply_joint_position_command(command)
-        elif command.type == "velocity":
-            self._apply_velocity_command(command)
-        else:
-            self.logger.warning(f"Unknown command type: {command.type}")
+        try:
+            handler = self._cmd_handlers[command.type]
+        except (IndexError, TypeError):
+            handler = None  # Unknown CmdType or legacy string type
+        if handler is None:
+            _LOG.warning("Unknown command type: %s", command.type)
+            return
+        handler(command, seed)
     
-    def _apply_joint_position_command(self, command: Command) -> None:
+    def _apply_joint_position_command(self, command: Command,
+                                      seed: Optional[np.ndarray] = None) -> None:
         """
         Apply a joint position command.
         
         Args:
             command: Joint position command.
+            seed: Unused; command handlers share one signature.
         """
-        if "positions" not in command.data:
-            self.logger.warning("Joint position command missing 'positions' data")
+        positions = command.data.get("positions")
+        if positions is None:
+            _LOG.warning("Joint position command missing 'positions' data")
             return
-            
-        positions = command.data["positions"]
-        for i, position in enumerate(positions):
-            if i < len(self.joint_states):
-                self.joint_states[i].position = position
+        
+        # Fast path: a full float64 array is copied without conversion
+        if (isinstance(positions, np.ndarray) and positions.dtype == np.float64
+                and positions.size == self.positions.size):
+            self.positions[...] = positions
+            return
+        
+        arr = np.asarray(positions, dtype=np.float64)
+        n = min(arr.size, self.positions.size)
+        self.positions[:n] = arr[:n]
     
-    def _apply_velocity_command(self, command: Command) -> None:
+    def _apply_velocity_command(self, command: Command,
+                                seed: Optional[np.ndarray] = None) -> None:
         """
         Apply a velocity command.
         
         Args:
             command: Velocity command.
+            seed: Unused; command handlers share one signature.
         """
         if "linear" not in command.data or "angular" not in command.data:
-            self.logger.warning("Velocity command missing 'linear' or 'angular' data")
+            _LOG.warning("Velocity command missing 'linear' or 'angular' data")
             return
             
         # In a real implementation, this would update the robot's velocity
-        linear = command.data["linear"]
-        angular = command.data["angular"]
-        self.logger.debug(f"Setting velocity to linear={linear}, angular={angular}")
+        if utils._DEBUG_ENABLED:
+            _LOG.debug("Setting velocity to linear=%s, angular=%s",
+                       command.data["linear"], command.data["angular"])
+    
+    def _apply_cartesian_command(self, command: Command,
+                                 seed: Optional[np.ndarray] = None) -> None:
+        """
+        Apply a cartesian end-effector position command.
+        
+        Args:
+            command: Cartesian command.
+            seed: Initial joint positions for inverse kinematics.
+        """
+        _LOG.warning("Robot type %s does not support cartesian commands",
+                     self.robot_type)
     
     def update(self, dt: float) -> None:
         """
@@ -160,9 +285,7 @@ class BaseRobot(RobotInterface):
         if not self.initialized:
             return
             
-        # In a real implementation, this would update the robot's state
-        # based on dynamics, control inputs, etc.
-        self.logger.debug(f"Updating robot state with dt={dt}")
+        step_joints(self.positions, self.velocities, self.efforts, dt)
 
 
 class Arm6DOF(BaseRobot):
@@ -171,32 +294,77 @@ class Arm6DOF(BaseRobot):
     def __init__(self, name: str):
         """Initialize a 6-DOF arm."""
         super().__init__(name)
+        self.workspace = WorkspaceFilter(ARM6_LINK_LENGTHS)
         self.initialize("arm_6dof")
     
+    def _apply_cartesian_command(self, command: Command,
+                                 seed: Optional[np.ndarray] = None) -> None:
+        """
+        Apply a cartesian end-effector position command.
+        
+        Targets outside the arm's workspace are rejected before running
+        inverse kinematics, and the joints are left unchanged if the
+        solver does not converge. Teleoperation targets move little
+        between commands, so the solver is warm-started from the current
+        joint positions unless a seed is given.
+        
+        Args:
+            command: Cartesian command with a 'position' Vector3 in the
+                arm base frame.
+            seed: Initial joint positions for inverse kinematics.
+        """
+        target = command.data.get("position")
+        if target is None:
+            _LOG.warning("Cartesian command missing 'position' data")
+            return
+        
+        if not self.workspace.is_reachable(target):
+            _LOG.warning("Cartesian target %s is outside the workspace", target)
+            return
+        
+        orientation = self.pose.orientation if self.pose else IDENTITY_QUAT
+        if seed is None:
+            seed = self.positions
+        q, converged = self.compute_inverse_kinematics(
+            Pose(position=target, orientation=orientation), seed
+        )
+        if not converged:
+            _LOG.warning("Inverse kinematics did not converge for %s", target)
+            return
+        self.positions[:] = q
+    
     def compute_forward_kinematics(self) -> Pose:
         """
         Compute forward kinematics for the arm.
         
         Returns:
-            End-effector pose.
+            End-effector pose in the arm base frame.
         """
-        # In a real implementation, this would compute the forward kinematics
-        # based on the current joint positions
-        return self.pose if self.pose else Pose(
-            position=Vector3(x=0.0, y=0.0, z=0.0),
-            orientation=Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
+        arr = fk6(self.positions)
+        return Pose(
+            position=Vector3.from_array(arr[:3]),
+            orientation=Quaternion.from_array(arr[3:])
         )
     
-    def compute_inverse_kinematics(self, target_pose: Pose) -> List[float]:
+    def compute_inverse_kinematics(self, target_pose: Pose,
+                                   seed: Optional[np.ndarray] = None
+                                   ) -> Tuple[List[float], bool]:
         """
         Compute inverse kinematics for the arm.
         
+        Only the target position is matched; the orientation is left to
+        the redundant joints, which stay close to the seed.
+        
         Args:
-            target_pose: Target end-effector pose.
+            target_pose: Target end-effector pose in the arm base frame.
+            seed: Initial joint positions for the solver.
             
         Returns:
-            Joint positions to achieve the target pose.
+            Tuple of the joint positions, wrapped to [-pi, pi), and
+            whether they reach the target. Unconverged positions are the
+            solver's last iterate and should not be applied.
         """
-        # In a real implementation, this would compute the inverse kinematics
-        # to achieve the target pose
-        return [0.0] * len(self.joint_states) 
\ No newline at end of file
+        if seed is None:
+            seed = np.zeros(self.positions.size)
+        q, converged = ik6_dls(target_pose.position.to_array(), seed)
+        return q.tolist(), converged
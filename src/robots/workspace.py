@@ -0,0 +1,49 @@
+"""
+Robot workspace helpers.
+
+This module provides cheap geometric checks on the reachable workspace
+of a serial manipulator, used to reject targets before running inverse
+kinematics.
+"""
+
+import numpy as np
+
+from src.common.interfaces import Vector3
+
+
+class WorkspaceFilter:
+    """
+    Spherical-shell bound on the workspace of a serial manipulator.
+
+    A chain of links cannot reach further than the sum of its link
+    lengths, nor closer than the longest link minus all others. Targets
+    outside this shell are unreachable, so they can be rejected with a
+    distance check instead of a full inverse kinematics solve.
+    """
+
+    def __init__(self, link_lengths: np.ndarray):
+        """
+        Initialize the filter.
+
+        Args:
+            link_lengths: Lengths of the links in meters.
+        """
+        link_lengths = np.abs(np.asarray(link_lengths, dtype=np.float64))
+        self.r_max = float(link_lengths.sum())
+        self.r_min = max(0.0, float(2.0 * link_lengths.max() - link_lengths.sum()))
+        # Compare squared distances to avoid a sqrt per check
+        self._r_max_sq = self.r_max ** 2
+        self._r_min_sq = self.r_min ** 2
+
+    def is_reachable(self, target: Vector3) -> bool:
+        """
+        Check whether a target may be reachable.
+
+        Args:
+            target: Target position in the robot base frame.
+
+        Returns:
+            False if the target is certainly unreachable, True otherwise.
+        """
+        d2 = target.x * target.x + target.y * target.y + target.z * target.z
+        return self._r_min_sq <= d2 <= self._r_max_sq
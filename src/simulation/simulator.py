@@ -5,17 +5,32 @@ This module provides the main simulation engine that handles physics,
 time management, and object interactions.
 """
 
+import math
 import time
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
 from src.common.interfaces import (
     Command, Pose, RobotState, SimulationInterface
 )
+from src.common import utils
 from src.common.utils import get_logger
 
 
+# Initial number of rows of the environment object columns
+_OBJECT_CAPACITY = 16
+
+
+@dataclass(slots=True)
+class RobotRecord:
+    """Simulation-side record of a robot."""
+    type: str
+    pose: Pose
+    state: RobotState
+
+
 class Simulator(SimulationInterface):
     """
     Main simulation engine implementation.
@@ -24,19 +39,33 @@ class Simulator(SimulationInterface):
     of all objects in the virtual environment.
     """
     
-    def __init__(self, physics_engine: str = "pybullet"):
+    def __init__(self, physics_engine: str = "pybullet",
+                 max_substep: float = 0.01):
         """
         Initialize the simulator.
         
         Args:
             physics_engine: Name of the physics engine to use.
+            max_substep: Largest time step in seconds taken by the
+                physics integrator; longer steps are subdivided.
+            
+        Raises:
+            ValueError: If max_substep is not positive.
         """
+        if not max_substep > 0:
+            raise ValueError(f"max_substep must be positive, got {max_substep}")
         self.logger = get_logger(__name__)
         self.physics_engine = physics_engine
-        self.robots: Dict[str, Dict] = {}
-        self.environment_objects: List[Dict] = []
+        self.max_substep = max_substep
+        self.robots: Dict[str, RobotRecord] = {}
+        # Environment objects are stored as parallel columns indexed by
+        # object ID. Positions live in one array, grown by doubling, so
+        # spatial queries can run over all objects at once.
+        self._object_types: List[str] = []
+        self._object_poses: List[Pose] = []
+        self._object_positions = np.empty((_OBJECT_CAPACITY, 3))
         self.time = 0.0
-        self.logger.info(f"Simulator initialized with {physics_engine} engine")
+        self.logger.info("Simulator initialized with %s engine", physics_engine)
     
     def step(self, dt: float) -> None:
         """
@@ -46,13 +75,31 @@ class Simulator(SimulationInterface):
             dt: Time step in seconds.
         """
         # In a real implementation, this would call the physics engine
-        self.logger.debug(f"Stepping simulation by {dt} seconds")
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Stepping simulation by %s seconds", dt)
+        
+        # Split long steps into equal substeps to keep integration stable
+        substeps = max(1, math.ceil(dt / self.max_substep))
+        substep_dt = dt / substeps
+        substep = self._substep
+        for _ in range(substeps):
+            substep(substep_dt)
+    
+    def _substep(self, dt: float) -> None:
+        """
+        Advance the physics by a single integration step.
+        
+        Args:
+            dt: Time step in seconds, at most ``max_substep``.
+        """
         self.time += dt
         
         # Update all robots in the simulation
+        debug = utils._DEBUG_ENABLED
         for robot_id in self.robots:
             # This would call the physics engine to update robot state
-            self.logger.debug(f"Updating robot {robot_id}")
+            if debug:
+                self.logger.debug("Updating robot %s", robot_id)
     
     def add_robot(self, robot_id: str, robot_type: str, pose: Pose) -> None:
         """
@@ -64,14 +111,14 @@ class Simulator(SimulationInterface):
             pose: Initial pose of the robot.
         """
         if robot_id in self.robots:
-            self.logger.warning(f"Robot {robot_id} already exists, replacing")
+            self.logger.warning("Robot %s already exists, replacing", robot_id)
         
-        self.robots[robot_id] = {
-            "type": robot_type,
-            "pose": pose,
-            "state": RobotState(joint_states=[], pose=pose, timestamp=self.time)
-        }
-        self.logger.info(f"Added robot {robot_id} of type {robot_type}")
+        self.robots[robot_id] = RobotRecord(
+            type=robot_type,
+            pose=pose,
+            state=RobotState(joint_states=[], pose=pose, timestamp=self.time)
+        )
+        self.logger.info("Added robot %s of type %s", robot_id, robot_type)
     
     def get_robot_state(self, robot_id: str) -> RobotState:
         """
@@ -91,7 +138,7 @@ class Simulator(SimulationInterface):
         
         # In a real implementation, this would query the physics engine
         # for the current robot state
-        return self.robots[robot_id]["state"]
+        return self.robots[robot_id].state
     
     def apply_command(self, robot_id: str, command: Command) -> None:
         """
@@ -109,7 +156,9 @@ class Simulator(SimulationInterface):
         
         # In a real implementation, this would translate the command into
         # physics engine actions
-        self.logger.info(f"Applying command {command.type} to robot {robot_id}")
+        if utils._DEBUG_ENABLED:
+            self.logger.debug("Applying command %s to robot %s",
+                              command.type, robot_id)
         
     def add_environment_object(self, object_type: str, pose: Pose) -> int:
         """
@@ -122,10 +171,32 @@ class Simulator(SimulationInterface):
         Returns:
             Index of the added object.
         """
-        object_id = len(self.environment_objects)
-        self.environment_objects.append({
-            "type": object_type,
-            "pose": pose,
-            "id": object_id
-        })
-        return object_id 
\ No newline at end of file
+        object_id = len(self._object_types)
+        if object_id == len(self._object_positions):
+            grown = np.empty((2 * object_id, 3))
+            grown[:object_id] = self._object_positions
+            self._object_positions = grown
+        position = pose.position
+        self._object_positions[object_id] = (position.x, position.y, position.z)
+        self._object_types.append(object_type)
+        self._object_poses.append(pose)
+        return object_id
+    
+    @property
+    def object_positions(self) -> np.ndarray:
+        """Positions of all environment objects as an (N, 3) view."""
+        return self._object_positions[:len(self._object_types)]
+    
+    @property
+    def environment_objects(self) -> List[Dict[str, Any]]:
+        """
+        Environment objects as one dict per object.
+        
+        The dicts are built on each access; prefer object_positions for
+        anything run per step.
+        """
+        return [
+            {"type": object_type, "pose": pose, "id": object_id}
+            for object_id, (object_type, pose) in enumerate(
+                zip(self._object_types, self._object_poses))
+        ] 
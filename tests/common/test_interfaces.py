@@ -0,0 +1,100 @@
+"""
+Tests for the interface data structures.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.common.interfaces import (
+    MAX_BATCH_SIZE, CmdType, Command, Quaternion, Vector3
+)
+from src.common.utils import quaternion_multiply
+
+
+class TestCommand(unittest.TestCase):
+    """Tests for the Command class."""
+
+    def test_legacy_string_type(self):
+        """Test that known string types become CmdType and others are kept."""
+        command = Command(type="velocity", data={}, timestamp=0.0)
+        self.assertIs(command.type, CmdType.VELOCITY)
+        self.assertEqual(str(command.type), "velocity")
+
+        command = Command(type="custom", data={}, timestamp=0.0)
+        self.assertEqual(command.type, "custom")
+
+    def test_encode_velocity(self):
+        """Test that velocity commands round-trip through a 17-byte record."""
+        command = Command(CmdType.VELOCITY, {"linear": 0.5, "angular": -0.25}, 1.5)
+        buf = command.encode()
+        self.assertEqual(len(buf), 17)
+        self.assertEqual(Command.decode(buf), command)
+
+    def test_encode_joint_position(self):
+        """Test that joint positions round-trip at float32 precision."""
+        positions = [0.1, -0.2, 0.3, 1.0, 2.0, -3.0]
+        command = Command(CmdType.JOINT_POSITION, {"positions": positions}, 2.0)
+        decoded = Command.decode(command.encode())
+        self.assertEqual(decoded.timestamp, 2.0)
+        self.assertIsInstance(decoded.data["positions"], list)
+        np.testing.assert_allclose(decoded.data["positions"], positions, rtol=1e-6)
+
+        # Values exact in float32 round-trip to an equal command
+        command = Command(CmdType.JOINT_POSITION,
+                          {"positions": [0.5, -0.25, 1.0, 2.0, -3.0, 0.125]}, 2.0)
+        self.assertEqual(Command.decode(command.encode()), command)
+
+    def test_encode_fallback(self):
+        """Test that commands without a packed format fall back to pickle."""
+        command = Command(CmdType.CARTESIAN,
+                          {"position": Vector3(x=1.0, y=0.0, z=0.0)}, 0.0)
+        self.assertEqual(Command.decode(command.encode()), command)
+
+    def test_encode_batch(self):
+        """Test that a batch is encoded as length-prefixed records."""
+        commands = [
+            Command(CmdType.VELOCITY, {"linear": 0.5, "angular": 0.0}, 1.0),
+            Command(CmdType.JOINT_POSITION, {"positions": [1.0, 2.0]}, 1.0),
+            Command(CmdType.CARTESIAN,
+                    {"position": Vector3(x=1.0, y=0.0, z=0.0)}, 1.0),
+        ]
+        buf = Command.encode_batch(commands[:1])
+        self.assertEqual(len(buf), 3 + 4 + 17)
+        self.assertEqual(Command.decode(buf), commands[:1])
+        self.assertEqual(Command.decode(Command.encode_batch(commands)), commands)
+
+        with self.assertRaises(ValueError):
+            Command.encode_batch(commands[:1] * (MAX_BATCH_SIZE + 1))
+
+
+class TestQuaternion(unittest.TestCase):
+    """Tests for the Quaternion class."""
+
+    def test_rotate(self):
+        """Test that rotate matches the quaternion sandwich product."""
+        half = np.sqrt(0.5)
+        np.testing.assert_allclose(
+            Quaternion(w=half, x=0.0, y=0.0, z=half).rotate([1.0, 0.0, 0.0]),
+            [0.0, 1.0, 0.0], atol=1e-12
+        )
+
+        q = np.array([0.5, -0.1, 0.7, 0.3])
+        q /= np.linalg.norm(q)
+        v = np.array([0.2, -1.5, 0.8])
+        expected = quaternion_multiply(
+            quaternion_multiply(q, np.concatenate(([0.0], v))),
+            q * [1.0, -1.0, -1.0, -1.0]
+        )[1:]
+        np.testing.assert_allclose(Quaternion.from_array(q).rotate(v), expected)
+
+    def test_rotate_batch(self):
+        """Test that rotate_batch matches rotate row by row."""
+        q = Quaternion.from_array(np.array([0.5, -0.1, 0.7, 0.3]) / np.sqrt(0.84))
+        v = np.random.default_rng(0).standard_normal((5, 3))
+        np.testing.assert_allclose(q.rotate_batch(v),
+                                   [q.rotate(row) for row in v])
+
+
+if __name__ == "__main__":
+    unittest.main()
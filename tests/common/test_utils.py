@@ -0,0 +1,129 @@
+"""
+Tests for the common utilities module.
+"""
+
+import logging
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from src.common import utils
+from src.common.utils import (
+    DeadlineSleeper, quaternion_multiply, rotation_matrix_to_quaternion, set_debug, throttle,
+    transform_pose, transform_pose_dict
+)
+
+
+def _rotation_z(angle):
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+class TestThrottle(unittest.TestCase):
+    """Tests for the throttle decorator."""
+
+    def test_first_call_runs(self):
+        """Test that the first call is never throttled."""
+        @throttle(60.0)
+        def func():
+            return "ran"
+
+        self.assertEqual(func(), "ran")
+        self.assertIsNone(func())
+
+    def test_concurrent_calls(self):
+        """Test that concurrent callers run the function only once."""
+        calls = []
+
+        @throttle(60.0)
+        def func():
+            calls.append(1)
+
+        threads = [threading.Thread(target=func) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+
+
+class TestDeadlineSleeper(unittest.TestCase):
+    """Tests for the DeadlineSleeper class."""
+
+    def test_wait_until(self):
+        """Test that waits end at, not before, each deadline."""
+        sleeper = DeadlineSleeper()
+        deadline = time.perf_counter()
+        for _ in range(5):
+            deadline += 0.01
+            sleeper.wait_until(deadline)
+            now = time.perf_counter()
+            self.assertGreaterEqual(now, deadline)
+            self.assertLess(now - deadline, 0.01)
+
+
+class TestLogging(unittest.TestCase):
+    """Tests for the logging helpers."""
+
+    def setUp(self):
+        """Save the root logger level."""
+        self.level = logging.getLogger().level
+
+    def tearDown(self):
+        """Restore the logger levels and the debug flag."""
+        logging.getLogger().setLevel(self.level)
+        logging.getLogger("src").setLevel(logging.NOTSET)
+        utils._DEBUG_ENABLED = False
+
+    def test_set_debug(self):
+        """Test that set_debug toggles the flag and the package logger only."""
+        logging.getLogger().setLevel(logging.WARNING)
+        set_debug(True)
+        self.assertTrue(utils._DEBUG_ENABLED)
+        self.assertEqual(logging.getLogger("src").level, logging.DEBUG)
+        self.assertEqual(logging.getLogger().level, logging.WARNING)
+
+        set_debug(False)
+        self.assertFalse(utils._DEBUG_ENABLED)
+        self.assertEqual(logging.getLogger("src").getEffectiveLevel(),
+                         logging.WARNING)
+
+
+class TestTransforms(unittest.TestCase):
+    """Tests for the pose transform helpers."""
+
+    def test_transform_pose(self):
+        """Test that transform_pose matches the matrix product."""
+        rotation = _rotation_z(0.3)
+        position = np.array([1.0, 2.0, 3.0])
+        translation = np.array([0.5, -1.0, 2.0])
+
+        result = transform_pose(position, rotation, translation)
+
+        np.testing.assert_allclose(result, rotation @ position + translation)
+
+    def test_transform_pose_dict(self):
+        """Test the dict wrapper rotates orientation and leaves input intact."""
+        pose = {
+            'position': {'x': 1.0, 'y': 0.0, 'z': 0.0},
+            'orientation': {'w': 1.0, 'x': 0.0, 'y': 0.0, 'z': 0.0},
+        }
+
+        result = transform_pose_dict(pose, np.zeros(3), _rotation_z(np.pi / 2))
+
+        self.assertAlmostEqual(result['position']['y'], 1.0)
+        self.assertAlmostEqual(result['orientation']['z'], np.sin(np.pi / 4))
+        self.assertEqual(pose['position']['x'], 1.0)
+
+    def test_quaternion_multiply(self):
+        """Test that composing rotations adds their angles."""
+        q = rotation_matrix_to_quaternion(_rotation_z(0.2))
+        expected = rotation_matrix_to_quaternion(_rotation_z(0.4))
+        np.testing.assert_allclose(quaternion_multiply(q, q), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
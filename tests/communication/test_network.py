@@ -0,0 +1,377 @@
+"""
+Tests for the communication module.
+"""
+
+import queue
+import selectors
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from src.common.interfaces import CmdType, Command
+from src.communication.network import (
+    GilbertElliot, NetworkChannel, NetworkSimulator, RandomLoss, _Scheduler,
+    _VirtualScheduler, pop_latest, put_overwrite
+)
+
+
+class TestNetworkChannel(unittest.TestCase):
+    """Tests for the NetworkChannel class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.channel = NetworkChannel("test_channel")
+        self.channel.start()
+        self.received = []
+        self.delivered = threading.Event()
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.channel.stop()
+
+    def _callback(self, data):
+        self.received.append((time.monotonic(), data))
+        self.delivered.set()
+
+    def test_delivery_after_latency(self):
+        """Test that data is delivered once the latency has elapsed."""
+        self.channel.set_conditions(0.05, 0.0, 0.0, None)
+
+        start = time.monotonic()
+        self.channel.send("payload", self._callback)
+
+        self.assertTrue(self.delivered.wait(timeout=1.0))
+        arrival, data = self.received[0]
+        self.assertEqual(data, "payload")
+        self.assertGreaterEqual(arrival - start, 0.05)
+
+    def test_delivery_order(self):
+        """Test that data is delivered in deadline order."""
+        self.channel.set_conditions(0.05, 0.0, 0.0, None)
+        self.channel.send("late", self._callback)
+        self.channel.set_conditions(0.0, 0.0, 0.0, None)
+        self.channel.send("early", self._callback)
+
+        deadline = time.monotonic() + 1.0
+        while len(self.received) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual([data for _, data in self.received], ["early", "late"])
+
+    def test_packet_loss(self):
+        """Test that all data is dropped with full packet loss."""
+        self.channel.set_conditions(0.0, 0.0, 1.0, None)
+        self.channel.send("payload", self._callback)
+
+        self.assertFalse(self.delivered.wait(timeout=0.05))
+
+    def test_dropped_packets_not_encoded(self):
+        """Test that data is serialized only for packets that survive loss."""
+        encoded = []
+        channel = NetworkChannel("lossy", encode=encoded.append, seed=0)
+        channel.set_conditions(0.0, 0.0, 1.0, None)
+        channel.send("payload", self._callback)
+        self.assertEqual(encoded, [])
+
+    def test_bandwidth_delay(self):
+        """Test that payload size over bandwidth delays delivery."""
+        payload = b"x" * 1000
+        self.channel.set_conditions(0.0, 0.0, 0.0, 10000.0)
+
+        start = time.monotonic()
+        self.channel.send(payload, self._callback)
+
+        self.assertTrue(self.delivered.wait(timeout=1.0))
+        arrival, _ = self.received[0]
+        self.assertGreaterEqual(arrival - start, 0.1)
+
+    def test_delivered_copy(self):
+        """Test that the receiver does not share state with the sender."""
+        data = {"positions": [0.0, 1.0]}
+        self.channel.send(data, self._callback)
+        data["positions"].append(2.0)
+
+        self.assertTrue(self.delivered.wait(timeout=1.0))
+        self.assertEqual(self.received[0][1], {"positions": [0.0, 1.0]})
+
+    def test_shared_scheduler(self):
+        """Test that channels share a single scheduler."""
+        other = NetworkChannel("other_channel")
+        self.assertIs(other._scheduler, self.channel._scheduler)
+        self.assertIs(self.channel._scheduler, _Scheduler.get())
+
+    def test_default_sink(self):
+        """Test that data is delivered to the channel sink by default."""
+        sink = queue.Queue()
+        channel = NetworkChannel("sink_channel", sink.put)
+        channel.start()
+        try:
+            channel.send("payload")
+            self.assertEqual(sink.get(timeout=1.0), "payload")
+        finally:
+            channel.stop()
+
+    def test_pop_latest(self):
+        """Test that pop_latest returns the newest item and drains the queue."""
+        q = queue.Queue()
+        self.assertIsNone(pop_latest(q))
+        for item in range(3):
+            q.put(item)
+        self.assertEqual(pop_latest(q), 2)
+        self.assertTrue(q.empty())
+
+    def test_put_overwrite(self):
+        """Test that put_overwrite discards the oldest item when full."""
+        q = queue.Queue(maxsize=2)
+        for item in range(3):
+            put_overwrite(q, item)
+        self.assertEqual([q.get_nowait(), q.get_nowait()], [1, 2])
+
+
+class TestVirtualClock(unittest.TestCase):
+    """Tests for NetworkSimulator in non-realtime mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.network = NetworkSimulator(realtime=False, seed=0)
+        self.network.set_network_conditions(0.1, 0.0, None)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.network.shutdown()
+
+    def test_delivery_on_advance(self):
+        """Test that data is delivered once the virtual clock reaches it."""
+        command = Command(type="velocity", data={"linear": 0.5}, timestamp=0.0)
+        self.network.send_command(command)
+
+        self.network.advance(0.05)
+        self.assertIsNone(self.network.receive_command())
+
+        self.network.advance(0.06)
+        self.assertEqual(self.network.receive_command(), command)
+        self.assertAlmostEqual(self.network.virtual_clock, 0.11)
+
+    def test_velocity_coalescing(self):
+        """Test that a newer velocity command supersedes an undelivered one."""
+        for linear in (0.1, 0.2, 0.3):
+            self.network.send_command(Command(
+                type="velocity", data={"linear": linear}, timestamp=0.0
+            ))
+        self.network.send_command(Command(
+            type="joint_position", data={"positions": [0.0]}, timestamp=0.0
+        ))
+
+        self.network.advance(0.2)
+        received = []
+        while (command := self.network.receive_command()) is not None:
+            received.append(command)
+
+        self.assertEqual(len(received), 2)
+        velocities = [c for c in received if c.type == CmdType.VELOCITY]
+        self.assertEqual(velocities[0].data["linear"], 0.3)
+
+    def test_failing_callback(self):
+        """Test that a failing delivery does not stop later ones."""
+        scheduler = _VirtualScheduler()
+        received = []
+
+        def fail(data):
+            raise RuntimeError("delivery failed")
+
+        scheduler.schedule(0.1, "first", fail)
+        scheduler.schedule(0.2, "second", received.append)
+        with self.assertLogs("src.communication.network", "ERROR"):
+            scheduler.advance(0.3)
+        self.assertEqual(received, ["second"])
+
+    def test_realtime_advance(self):
+        """Test that advance is rejected in realtime mode."""
+        network = NetworkSimulator()
+        try:
+            with self.assertRaises(RuntimeError):
+                network.advance(0.1)
+        finally:
+            network.shutdown()
+
+
+    def test_wakeup_fd(self):
+        """Test that the wakeup fd is readable only while data is pending."""
+        selector = selectors.DefaultSelector()
+        selector.register(self.network.readable_fd(), selectors.EVENT_READ)
+        try:
+            self.assertEqual(selector.select(0), [])
+
+            self.network.send_command(
+                Command(type="velocity", data={"linear": 0.5}, timestamp=0.0)
+            )
+            self.network.advance(0.2)
+            self.assertEqual(len(selector.select(0)), 1)
+
+            self.network.clear_wakeup()
+            self.assertEqual(selector.select(0), [])
+            self.assertIsNotNone(self.network.receive_command())
+        finally:
+            selector.close()
+
+    def test_wakeup_delivery_during_clear(self):
+        """Test that a delivery landing while the wakeup is cleared is not lost."""
+        network = self.network
+        command = Command(type="velocity", data={"linear": 0.5}, timestamp=0.0)
+        network.send_command(command)
+        network.advance(0.2)
+
+        class DeliveringSocket:
+            """Wakeup socket that delivers a command on the first recv."""
+            def __init__(self, sock):
+                self.sock = sock
+                self.delivered = False
+
+            def recv(self, n):
+                if not self.delivered:
+                    self.delivered = True
+                    network._put(network.command_queue, command)
+                return self.sock.recv(n)
+
+        wakeup_r = network._wakeup_r
+        network._wakeup_r = DeliveringSocket(wakeup_r)
+        try:
+            network.clear_wakeup()
+        finally:
+            network._wakeup_r = wakeup_r
+        self.assertEqual(network.receive_commands(), [command, command])
+
+        selector = selectors.DefaultSelector()
+        selector.register(network.readable_fd(), selectors.EVENT_READ)
+        try:
+            network._put(network.command_queue, command)
+            self.assertEqual(len(selector.select(0)), 1)
+        finally:
+            selector.close()
+
+
+class TestBatching(unittest.TestCase):
+    """Tests for batched sends and receives."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.network = NetworkSimulator(realtime=False, seed=0)
+        self.network.set_network_conditions(0.1, 0.0, None)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.network.shutdown()
+
+    def test_batch_order_and_coalescing(self):
+        """Test that a batch arrives in order with superseded setpoints removed."""
+        commands = [
+            Command(type="velocity", data={"linear": 0.1}, timestamp=0.0),
+            Command(type="joint_position", data={"positions": [1.0]}, timestamp=0.0),
+            Command(type="velocity", data={"linear": 0.2}, timestamp=0.0),
+        ]
+        self.network.send_commands(commands)
+
+        self.network.advance(0.2)
+        received = self.network.receive_commands()
+
+        self.assertEqual(received, commands[1:])
+        self.assertEqual(self.network.receive_commands(), [])
+
+    def test_batch_supersedes_pending(self):
+        """Test that batches coalesce with velocity commands sent earlier."""
+        for linear in (0.1, 0.2, 0.3):
+            self.network.send_commands([
+                Command(type="velocity", data={"linear": linear}, timestamp=0.0)
+            ])
+        self.network.advance(0.2)
+        self.assertEqual(
+            [c.data["linear"] for c in self.network.receive_commands()], [0.3]
+        )
+
+        self.network.send_command(
+            Command(type="velocity", data={"linear": 0.4}, timestamp=0.0)
+        )
+        batch = [
+            Command(type="joint_position", data={"positions": [1.0]}, timestamp=0.0),
+            Command(type="velocity", data={"linear": 0.5}, timestamp=0.0),
+        ]
+        self.network.send_commands(batch)
+        self.network.advance(0.2)
+        self.assertEqual(self.network.receive_commands(), batch)
+
+
+class TestJitter(unittest.TestCase):
+    """Tests for jitter distributions and network presets."""
+
+    def test_normal_jitter_truncated(self):
+        """Test that normal jitter is centered and bounded at three sigma."""
+        channel = NetworkChannel("test_channel", seed=0)
+        channel.set_conditions(0.1, 0.02, 0.0, None,
+                               jitter_distribution="normal")
+        samples = channel._draw_jitter(100000)
+        self.assertAlmostEqual(samples.mean(), 0.0, delta=0.01)
+        self.assertAlmostEqual(samples.std(), 0.5, delta=0.01)
+        self.assertLessEqual(np.abs(samples).max(), 1.5)
+
+    def test_invalid_bandwidth(self):
+        """Test that a zero or negative bandwidth is rejected."""
+        channel = NetworkChannel("test_channel")
+        for bandwidth in (0.0, -1.0):
+            with self.assertRaises(ValueError):
+                channel.set_conditions(0.1, 0.0, 0.0, bandwidth)
+
+    def test_unknown_distribution(self):
+        """Test that unknown distributions and empty tables are rejected."""
+        channel = NetworkChannel("test_channel")
+        with self.assertRaises(ValueError):
+            channel.set_conditions(0.1, 0.02, 0.0, None,
+                                   jitter_distribution="cauchy")
+        with self.assertRaises(ValueError):
+            channel.set_conditions(0.1, 0.02, 0.0, None,
+                                   jitter_distribution=[])
+
+    def test_network_preset(self):
+        """Test that a preset configures both channels."""
+        network = NetworkSimulator(realtime=False, seed=0)
+        try:
+            network.set_network_preset("satellite")
+            for channel in (network.operator_to_robot, network.robot_to_operator):
+                self.assertEqual(channel.latency, 0.3)
+                self.assertIsInstance(channel.loss_model, GilbertElliot)
+            self.assertIsNot(network.operator_to_robot.loss_model,
+                             network.robot_to_operator.loss_model)
+            with self.assertRaises(ValueError):
+                network.set_network_preset("dialup")
+        finally:
+            network.shutdown()
+
+
+class TestLossModels(unittest.TestCase):
+    """Tests for the packet loss models."""
+
+    def test_random_loss(self):
+        """Test the independent loss model threshold."""
+        model = RandomLoss(0.25)
+        self.assertTrue(model.drop(0.1))
+        self.assertFalse(model.drop(0.5))
+        self.assertEqual(model.loss_rate, 0.25)
+
+    def test_gilbert_elliot_loss_rate(self):
+        """Test that the simulated loss rate matches the stationary rate."""
+        model = GilbertElliot.wifi()
+        samples = np.random.default_rng(0).random(200000)
+        drops = [model.drop(u) for u in samples]
+        self.assertAlmostEqual(np.mean(drops), model.loss_rate, delta=0.005)
+
+    def test_gilbert_elliot_bursts(self):
+        """Test that losses cluster while the link is in the bad state."""
+        model = GilbertElliot(p=0.0, r=0.0, h=0.0, k=1.0)
+        self.assertFalse(model.drop(0.5))
+        model.bad = True
+        self.assertTrue(all(model.drop(u) for u in (0.1, 0.5, 0.9)))
+
+
+if __name__ == "__main__":
+    unittest.main()
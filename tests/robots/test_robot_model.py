@@ -0,0 +1,143 @@
+"""
+Tests for the robot models module.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.common.interfaces import Command, Vector3
+from src.robots.kinematics import fk6, ik6_dls
+from src.robots.robot_model import Arm6DOF
+from src.robots.workspace import WorkspaceFilter
+
+
+class TestWorkspaceFilter(unittest.TestCase):
+    """Tests for the WorkspaceFilter class."""
+
+    def test_bounds(self):
+        """Test the reachable shell computed from link lengths."""
+        workspace = WorkspaceFilter(np.array([1.0, 0.5, 0.25]))
+
+        self.assertAlmostEqual(workspace.r_max, 1.75)
+        self.assertAlmostEqual(workspace.r_min, 0.25)
+        self.assertTrue(workspace.is_reachable(Vector3(x=1.0, y=0.0, z=0.0)))
+        self.assertFalse(workspace.is_reachable(Vector3(x=2.0, y=0.0, z=0.0)))
+        self.assertFalse(workspace.is_reachable(Vector3(x=0.1, y=0.0, z=0.0)))
+
+
+class TestKinematics(unittest.TestCase):
+    """Tests for the arm kinematics."""
+
+    def test_fk_zero(self):
+        """Test the end-effector pose with all joints at zero."""
+        np.testing.assert_allclose(
+            fk6(np.zeros(6))[:3], [-0.81725, -0.19145, -0.005491], atol=1e-6
+        )
+
+    def test_ik_round_trip(self):
+        """Test that IK reaches the FK position of a nearby configuration."""
+        q_goal = np.array([0.3, -1.2, 1.4, -0.5, 1.1, 0.2])
+        target = fk6(q_goal)[:3]
+
+        q, converged = ik6_dls(target, q_goal + 0.2)
+
+        self.assertTrue(converged)
+        np.testing.assert_allclose(fk6(q)[:3], target, atol=1e-4)
+
+    def test_ik_wraps_angles(self):
+        """Test that IK solutions are wrapped even from an unwrapped seed."""
+        q_goal = np.array([0.3, -1.2, 1.4, -0.5, 1.1, 0.2])
+        target = fk6(q_goal)[:3]
+
+        q, converged = ik6_dls(target, q_goal + 6 * np.pi)
+
+        self.assertTrue(converged)
+        self.assertTrue(np.all(np.abs(q) <= np.pi))
+        np.testing.assert_allclose(fk6(q)[:3], target, atol=1e-4)
+
+
+class TestArm6DOF(unittest.TestCase):
+    """Tests for the Arm6DOF class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.arm = Arm6DOF("test_arm")
+
+    def test_unreachable_cartesian_command(self):
+        """Test that unreachable cartesian targets leave the joints unchanged."""
+        self.arm.apply_command(Command(
+            type="joint_position", data={"positions": [0.5] * 6}, timestamp=0.0
+        ))
+
+        self.arm.apply_command(Command(
+            type="cartesian",
+            data={"position": Vector3(x=10.0, y=0.0, z=0.0)},
+            timestamp=0.0
+        ))
+
+        self.assertTrue(all(j.position == 0.5 for j in self.arm.joint_states))
+        np.testing.assert_array_equal(self.arm.get_state_arrays().positions,
+                                      np.full(6, 0.5))
+
+    def test_update_integrates_efforts(self):
+        """Test that update integrates joint efforts into velocities and positions."""
+        self.arm.efforts[:] = 1.0
+        self.arm.update(0.1)
+        self.arm.update(0.1)
+
+        np.testing.assert_allclose(self.arm.velocities, np.full(6, 0.2))
+        np.testing.assert_allclose(self.arm.positions, np.full(6, 0.03))
+
+    def test_joint_arrays_not_rebindable(self):
+        """Test that joint arrays can only be modified in place."""
+        with self.assertRaises(AttributeError):
+            self.arm.positions = np.ones(6)
+        self.arm.positions[:] = 1.0
+        self.assertEqual(self.arm.get_state().joint_states[0].position, 1.0)
+
+    def test_get_state_reused_until_joints_change(self):
+        """Test that get_state returns the same state until the joints move."""
+        state = self.arm.get_state()
+        self.assertIs(self.arm.get_state(), state)
+
+        self.arm.positions[0] = 0.5
+        moved = self.arm.get_state()
+        self.assertIsNot(moved, state)
+        self.assertEqual(moved.joint_states[0].position, 0.5)
+        self.assertEqual(state.joint_states[0].position, 0.0)
+
+    def test_cartesian_command(self):
+        """Test that a cartesian command moves the end effector to the target."""
+        target = Vector3(x=0.4, y=-0.2, z=0.3)
+        self.arm.apply_command(Command(
+            type="joint_position",
+            data={"positions": [0.0, -1.0, 1.0, 0.0, 0.5, 0.0]},
+            timestamp=0.0
+        ))
+
+        self.arm.apply_command(Command(
+            type="cartesian", data={"position": target}, timestamp=0.0
+        ))
+
+        position = self.arm.compute_forward_kinematics().position
+        np.testing.assert_allclose(position.to_array(), target.to_array(), atol=1e-4)
+
+
+    def test_unconverged_cartesian_command(self):
+        """Test that an unconverged IK solve leaves the joints unchanged."""
+        self.arm.positions[:] = 0.5
+        with patch("src.robots.robot_model.ik6_dls",
+                   return_value=(np.full(6, 3.0), False)):
+            with self.assertLogs("src.robots.robot_model", "WARNING"):
+                self.arm.apply_command(Command(
+                    type="cartesian",
+                    data={"position": Vector3(x=0.4, y=-0.2, z=0.3)},
+                    timestamp=0.0
+                ))
+
+        np.testing.assert_array_equal(self.arm.positions, np.full(6, 0.5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,8 +32,8 @@ class TestSimulator(unittest.TestCase):
         """Test adding a robot to the simulator."""
         # Check that the robot was added correctly
         self.assertIn(self.robot_id, self.simulator.robots)
-        self.assertEqual(self.simulator.robots[self.robot_id]["type"], self.robot_type)
-        self.assertEqual(self.simulator.robots[self.robot_id]["pose"], self.robot_pose)
+        self.assertEqual(self.simulator.robots[self.robot_id].type, self.robot_type)
+        self.assertEqual(self.simulator.robots[self.robot_id].pose, self.robot_pose)
     
     def test_get_robot_state(self):
         """Test getting robot state."""
@@ -56,6 +56,25 @@ class TestSimulator(unittest.TestCase):
         # Check that the time advanced correctly
         self.assertAlmostEqual(self.simulator.time, initial_time + dt)
     
+    def test_step_substeps(self):
+        """Test that long steps are split into bounded substeps."""
+        self.simulator.max_substep = 0.01
+        
+        with patch.object(self.simulator, "_substep",
+                          wraps=self.simulator._substep) as substep:
+            self.simulator.step(0.05)
+        
+        self.assertEqual(substep.call_count, 5)
+        for call in substep.call_args_list:
+            self.assertLessEqual(call.args[0], 0.01 + 1e-12)
+        self.assertAlmostEqual(self.simulator.time, 0.05)
+    
+    def test_invalid_max_substep(self):
+        """Test that a non-positive max_substep is rejected."""
+        for max_substep in (0.0, -0.01):
+            with self.assertRaises(ValueError):
+                Simulator(max_substep=max_substep)
+    
     def test_apply_command(self):
         """Test applying a command to a robot."""
         # Create a test command
@@ -89,6 +108,18 @@ class TestSimulator(unittest.TestCase):
         self.assertEqual(self.simulator.environment_objects[0]["pose"], object_pose)
         self.assertEqual(self.simulator.environment_objects[0]["id"], object_id)
     
+    def test_object_positions_grow(self):
+        """Test that object positions are kept for many objects."""
+        for i in range(40):
+            self.simulator.add_environment_object("cube", Pose(
+                position=Vector3(x=float(i), y=0.0, z=0.0),
+                orientation=Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
+            ))
+        
+        positions = self.simulator.object_positions
+        self.assertEqual(positions.shape, (40, 3))
+        self.assertEqual(list(positions[:, 0]), [float(i) for i in range(40)])
+    
     def test_nonexistent_robot(self):
         """Test handling of a nonexistent robot."""
         # Try to get state of a nonexistent robot